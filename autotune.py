@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+
+import os, json, time, itertools, math
+
+class Autotune:
+    def __init__(self, space, sizes, margin):
+        self.space       = space
+        self.sizes       = sizes
+        self.margin      = margin
+        self.configs     = []
+        self.results     = {}
+        self.failed      = set()
+        self.scores      = {}
+        self.round_index = 0
+        self.default_space = {'HCCL_OVER_TCP':   ['1'],
+                              'SOCKET_NTHREADS': ['1', '2', '4', '8'],
+                              'NSOCK_PERTHREAD': ['1', '2', '3', '4']}
+
+    def load_space(self):
+        '''Read the search space. The space is a mapping of env variable to its candidate values,
+           or a list of such mappings whose cross products are combined, for example one mapping
+           for HCCL_OVER_TCP and its socket knobs and another one for HCCL_OVER_OFI.
+           JSON is always supported, YAML requires the PyYAML package.'''
+        if not self.space:
+            return [self.default_space]
+        with open(self.space) as space_file:
+            if self.space.endswith(('.yaml', '.yml')):
+                try:
+                    import yaml
+                except ModuleNotFoundError:
+                    raise ValueError(f'PyYAML package is required for reading {self.space}, please install it or use a JSON space file')
+                space = yaml.safe_load(space_file)
+            else:
+                space = json.load(space_file)
+        space = space if isinstance(space, list) else [space]
+        if not space or not all(isinstance(subspace, dict) and subspace for subspace in space):
+            raise ValueError(f'Search space {self.space} must be a non empty mapping or a list of non empty mappings')
+        return space
+
+    def expand(self):
+        '''Expand the search space into configurations. Every configuration sets all the variables
+           of the space, variables which are not part of its subspace are set to None (unset).'''
+        space = self.load_space()
+        env_names = []
+        for subspace in space:
+            env_names.extend(name for name in subspace if name not in env_names)
+        self.configs = []
+        for subspace in space:
+            names  = list(subspace)
+            values = [[str(value) for value in (subspace[name] if isinstance(subspace[name], list) else [subspace[name]])] for name in names]
+            for combination in itertools.product(*values):
+                config = dict.fromkeys(env_names)
+                config.update(zip(names, combination))
+                if config not in self.configs:
+                    self.configs.append(config)
+        return self.configs
+
+    def update(self, config, summary_path):
+        '''Store the bandwidth measured by a configuration for every size, as written by rank 0.
+           Returns the sizes for which no result was found.'''
+        key = self.get_key(config)
+        self.results[key] = {}
+        if os.path.exists(summary_path):
+            with open(summary_path) as summary_file:
+                for line in summary_file:
+                    if line.strip():
+                        summary = json.loads(line)
+                        self.results[key][summary['size']] = summary['bandwidth']
+        return [size for size in self.sizes if size not in self.results[key]]
+
+    def set_failed(self, config):
+        '''Record a configuration whose launch failed with no bandwidth for every size.'''
+        key = self.get_key(config)
+        self.failed.add(key)
+        self.results[key] = {size: 0 for size in self.sizes}
+
+    def has_results(self):
+        '''Check whether any bandwidth was collected for the remaining configurations.'''
+        return any(bandwidth > 0 for config in self.configs for bandwidth in self.results.get(self.get_key(config), {}).values())
+
+    def prune(self):
+        '''Early stopping: score every configuration by the geometric mean of its bandwidth relative
+           to the best configuration of each size band, and drop the configurations which are worse than
+           the best one by more than the margin in every size band.
+           The best scoring configuration is always kept, so a round is never pruned down to nothing.
+           Returns the dropped configurations.'''
+        best = self.get_best_per_size()
+        survivors = []
+        dropped   = []
+        self.scores = {}
+        for config in self.configs:
+            results  = self.results.get(self.get_key(config), {})
+            relative = [results.get(size, 0) / best[size][1] if best[size][1] > 0 else 0 for size in self.sizes]
+            self.scores[self.get_key(config)] = math.exp(sum(math.log(max(value, 1e-12)) for value in relative) / len(relative))
+            if any(value >= 1 - self.margin for value in relative):
+                survivors.append(config)
+            else:
+                dropped.append(config)
+        if not survivors:
+            best_config = max(dropped, key=lambda config: self.scores[self.get_key(config)])
+            survivors.append(best_config)
+            dropped.remove(best_config)
+        self.configs = survivors
+        self.round_index += 1
+        return dropped
+
+    def get_best_per_size(self):
+        '''Find the best surviving configuration and its bandwidth for every size band.'''
+        best = {size: (None, 0) for size in self.sizes}
+        for config in self.configs:
+            results = self.results.get(self.get_key(config), {})
+            for size in self.sizes:
+                if results.get(size, 0) > best[size][1]:
+                    best[size] = (config, results[size])
+        return best
+
+    def get_best(self):
+        '''The overall best configuration has the highest score over all the size bands.'''
+        return max(self.configs, key=lambda config: self.scores.get(self.get_key(config), 0))
+
+    def get_bands(self):
+        '''Every requested size starts a band which ends right before the next requested size.'''
+        bands = []
+        for index, size in enumerate(self.sizes):
+            end = f'{self.sizes[index + 1] - 1} B' if index + 1 < len(self.sizes) else 'and above'
+            bands.append((size, f'{size} B - {end}'))
+        return bands
+
+    def get_report_lines(self, test):
+        '''Format the bandwidth of every surviving configuration per size band.'''
+        best  = self.get_best_per_size()
+        lines = [f'Autotune round {self.round_index} results for {test}:']
+        for config in sorted(self.configs, key=lambda config: -self.scores.get(self.get_key(config), 0)):
+            results = self.results.get(self.get_key(config), {})
+            bandwidths = ' '.join(f'{size}:{results.get(size, 0) / 1e6:.3f}' for size in self.sizes)
+            failed = '  (failed)' if self.get_key(config) in self.failed else ''
+            lines.append(f'    score {self.scores.get(self.get_key(config), 0):.3f}  {self.describe(config)}  MB/s per size [{bandwidths}]{failed}')
+        lines.append('Best configuration per size band:')
+        for size, band in self.get_bands():
+            lines.append(f'    {band.ljust(30)} {self.describe(best[size][0])} ({best[size][1] / 1e6:.3f} MB/s)')
+        return lines
+
+    def write_env_file(self, path, test):
+        '''Write the overall best configuration as an env file which can be sourced,
+           with the best configuration of every size band as comments.'''
+        best   = self.get_best_per_size()
+        config = self.get_best()
+        lines  = [f'# HCCL demo autotune results for {test}, generated on {time.strftime("%Y-%m-%d %H:%M:%S")}',
+                  '# Best configuration per size band:']
+        for size, band in self.get_bands():
+            lines.append(f'#   {band.ljust(30)} {self.describe(best[size][0])} ({best[size][1] / 1e6:.3f} MB/s)')
+        lines.append('# Best configuration over all size bands:')
+        for name, value in config.items():
+            lines.append(f'export {name}={value}' if value is not None else f'unset {name}')
+        with open(path, 'w') as env_file:
+            env_file.write('\n'.join(lines) + '\n')
+        return config
+
+    def describe(self, config):
+        if not config:
+            return 'none'
+        return ' '.join(f'{name}={value}' for name, value in config.items() if value is not None)
+
+    def get_key(self, config):
+        return json.dumps(config, sort_keys=True)
@@ -16,6 +16,8 @@
 #include <sstream>
 #include <numeric>
 #include <fstream>
+#include <sys/socket.h>  // for progress reporting
+#include <sys/un.h>
 
 // HCCL :: Habana Collective Communications Library
 #include <hccl.h>
@@ -33,6 +35,9 @@
 //#define DEFAULT_BOX_SIZE  8
 #define DEFAULT_BOX_SIZE  4
 #define NUMBER_OF_WARMUPS 100
+#define HOST_NAME_MAX_LEN 256
+#define DEFAULT_SLOWEST_RANKS 3
+#define RANK_STAT_FIELDS  3  // duration, module id, node id
 
 #if MPI_ENABLED
 // Open MPI (v4.0.2)
@@ -78,11 +83,20 @@ struct hccl_demo_data
     size_t          num_iters;
 };
 
+struct hccl_demo_rank_stat
+{
+    int   rank;
+    float duration_in_sec;
+    int   module_id;
+    int   node_id;
+};
+
 struct hccl_demo_stats
 {
-    float  avg_duration_in_sec;
-    float  rank_duration_in_sec;
-    size_t num_iters;
+    float                       avg_duration_in_sec;
+    float                       rank_duration_in_sec;
+    size_t                      num_iters;
+    vector<hccl_demo_rank_stat> rank_stats;
 };
 
 ostream& log()
@@ -90,82 +104,6 @@ ostream& log()
     return cout;
 }
 
-hcclResult_t get_avg_duration(hccl_demo_data& demo_data, hccl_demo_stats& stat)
-{
-    float&      rank_duration       = stat.rank_duration_in_sec;
-    float&      avg_duration        = stat.avg_duration_in_sec;
-    uint64_t    data_size           = sizeof(stat.rank_duration_in_sec);
-    uint64_t    count               = data_size / sizeof(float);
-    const void* input_host_data_ptr = reinterpret_cast<void*>(&rank_duration);
-
-    uint64_t input_dev_ptr {};
-    uint64_t output_dev_ptr {};
-
-    CHECK_SYNAPSE_STATUS(synDeviceMalloc(demo_data.device_handle, data_size, 0, 0, &input_dev_ptr));
-    CHECK_SYNAPSE_STATUS(synDeviceMalloc(demo_data.device_handle, data_size, 0, 0, &output_dev_ptr));
-    CHECK_SYNAPSE_STATUS(synHostMap(demo_data.device_handle, data_size, input_host_data_ptr));
-    CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.host_to_device_stream,
-                                         (uint64_t) input_host_data_ptr,
-                                         data_size,
-                                         input_dev_ptr,
-                                         HOST_TO_DRAM));
-    CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.host_to_device_stream));
-    CHECK_HCCL_STATUS(hcclAllReduce((const void*) input_dev_ptr,
-                                    (void*) output_dev_ptr,
-                                    count,
-                                    hcclFloat32,
-                                    hcclSum,
-                                    demo_data.hccl_comm,
-                                    demo_data.collective_stream));
-    CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.collective_stream));
-
-    const void* output_host_data_ptr = reinterpret_cast<void*>(&avg_duration);
-
-    CHECK_SYNAPSE_STATUS(synHostMap(demo_data.device_handle, data_size, output_host_data_ptr));
-    CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.device_to_host_stream,
-                                         output_dev_ptr,
-                                         data_size,
-                                         (uint64_t) output_host_data_ptr,
-                                         DRAM_TO_HOST));
-    CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.device_to_host_stream));
-
-    avg_duration = avg_duration / demo_data.nranks;
-
-    return hcclSuccess;
-}
-
-hccl_demo_stats benchmark(hccl_demo_data& demo_data, const function<void()>& fn)
-{
-    // Warmup run
-    hccl_demo_stats stat;
-    auto            num_warmup_iters = size_t {NUMBER_OF_WARMUPS};
-
-    for (size_t iter = 0; iter < num_warmup_iters; ++iter)
-    {
-        fn();
-    }
-
-    CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.collective_stream));
-
-    // Actual iterations
-    auto start_time = Clock::now();
-
-    for (size_t iter = 0; iter < demo_data.num_iters; ++iter)
-    {
-        fn();
-    }
-
-    CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.collective_stream));
-
-    auto duration             = Clock::now() - start_time;
-    stat.rank_duration_in_sec = chrono::duration_cast<chrono::duration<double>>(duration).count();
-    stat.rank_duration_in_sec = stat.rank_duration_in_sec / demo_data.num_iters;
-
-    CHECK_HCCL_STATUS(get_avg_duration(demo_data, stat));
-
-    return stat;
-}
-
 bool should_report_stat(int rank)
 {
     return rank == 0;
@@ -178,6 +116,13 @@ inline string format_bw(const double bytes_per_sec)
     return ss.str();
 }
 
+inline string format_duration(const double duration_in_sec)
+{
+    stringstream ss;
+    ss << fixed << setprecision(3) << duration_in_sec * 1e3 << " ms";
+    return ss.str();
+}
+
 string get_print_delimiter(size_t length, char delimiter)
 {
     stringstream ss;
@@ -232,17 +177,27 @@ int get_demo_test_root()
     return test_root;
 }
 
-int get_demo_test_size()
+vector<uint64_t> get_demo_test_sizes()
 {
-    static bool is_cached = false;
-    static auto test_size = DEFAULT_TEST_SIZE;
+    static bool is_cached  = false;
+    static auto test_sizes = vector<uint64_t> {DEFAULT_TEST_SIZE};
     if (!is_cached)
     {
+        // A comma separated list of sizes is tested within a single launch
         char* env_value = getenv("HCCL_DEMO_TEST_SIZE");
-        test_size       = (env_value != nullptr) ? atoi(env_value) : test_size;
-        is_cached       = true;
+        if (env_value != nullptr)
+        {
+            test_sizes.clear();
+            stringstream ss(env_value);
+            string       test_size;
+            while (getline(ss, test_size, ','))
+            {
+                test_sizes.push_back(strtoull(test_size.c_str(), nullptr, 10));
+            }
+        }
+        is_cached = true;
     }
-    return test_size;
+    return test_sizes;
 }
 
 int get_demo_test_loop()
@@ -271,6 +226,19 @@ string get_demo_csv_path()
     return csv_path;
 }
 
+string get_demo_summary_path()
+{
+    static bool is_cached    = false;
+    static auto summary_path = string {""};
+    if (!is_cached)
+    {
+        char* env_value = getenv("HCCL_DEMO_SUMMARY_PATH");
+        summary_path    = (env_value != nullptr) ? string(env_value) : summary_path;
+        is_cached       = true;
+    }
+    return summary_path;
+}
+
 int get_nranks()
 {
 #if MPI_ENABLED
@@ -323,6 +291,366 @@ int get_hccl_rank()
     return test_rank;
 }
 
+#if MPI_ENABLED
+int get_mpi_node_id()
+{
+    // Ranks are not necessarily placed by slot (e.g. --map-by node or an uneven layout), therefore
+    // the node ID is derived from the host names. Nodes are numbered by the order of their first rank.
+    int  mpi_size {};
+    char host_name[HOST_NAME_MAX_LEN] {};
+    CHECK_MPI_STATUS(MPI_Comm_size(MPI_COMM_WORLD, &mpi_size));
+    gethostname(host_name, HOST_NAME_MAX_LEN - 1);
+
+    auto host_names = vector<char>(mpi_size * HOST_NAME_MAX_LEN);
+    CHECK_MPI_STATUS(MPI_Allgather(
+        host_name, HOST_NAME_MAX_LEN, MPI_CHAR, host_names.data(), HOST_NAME_MAX_LEN, MPI_CHAR, MPI_COMM_WORLD));
+
+    auto nodes = vector<string> {};
+    for (int rank = 0; rank < mpi_size; ++rank)
+    {
+        string rank_host_name {&host_names[rank * HOST_NAME_MAX_LEN]};
+        if (find(nodes.begin(), nodes.end(), rank_host_name) == nodes.end())
+        {
+            nodes.push_back(rank_host_name);
+        }
+        if (rank_host_name == host_name)
+        {
+            return nodes.size() - 1;
+        }
+    }
+    return -1;
+}
+#endif  // MPI_ENABLED
+
+int get_demo_node_id()
+{
+    static bool is_cached = false;
+    static auto node_id   = -1;
+    if (!is_cached)
+    {
+        char* env_value = getenv("HCCL_DEMO_NODE_ID");
+#if MPI_ENABLED
+        node_id = (env_value != nullptr) ? atoi(env_value) : get_mpi_node_id();
+#else
+        node_id = (env_value != nullptr) ? atoi(env_value) : get_hccl_rank() / get_demo_box_size();
+#endif  // MPI_ENABLED
+        is_cached = true;
+    }
+    return node_id;
+}
+
+size_t get_demo_slowest_ranks()
+{
+    static bool is_cached     = false;
+    static auto slowest_ranks = DEFAULT_SLOWEST_RANKS;
+    if (!is_cached)
+    {
+        char* env_value = getenv("HCCL_DEMO_SLOWEST_RANKS");
+        slowest_ranks   = (env_value != nullptr) ? atoi(env_value) : slowest_ranks;
+        is_cached       = true;
+    }
+    return slowest_ranks;
+}
+
+double to_seconds(Clock::duration duration)
+{
+    return chrono::duration_cast<chrono::duration<double>>(duration).count();
+}
+
+string get_demo_progress_socket()
+{
+    static bool is_cached       = false;
+    static auto progress_socket = string {""};
+    if (!is_cached)
+    {
+        char* env_value = getenv("HCCL_DEMO_PROGRESS_SOCKET");
+        progress_socket = (env_value != nullptr) ? string(env_value) : progress_socket;
+        is_cached       = true;
+    }
+    return progress_socket;
+}
+
+double get_demo_progress_interval()
+{
+    static bool is_cached         = false;
+    static auto progress_interval = 0.0;
+    if (!is_cached)
+    {
+        char* env_value   = getenv("HCCL_DEMO_PROGRESS_INTERVAL");
+        progress_interval = (env_value != nullptr) ? atof(env_value) : progress_interval;
+        is_cached         = true;
+    }
+    return progress_interval;
+}
+
+bool is_progress_enabled()
+{
+    return !get_demo_progress_socket().empty() && get_demo_progress_interval() > 0;
+}
+
+void report_progress(
+    const string& phase, size_t data_size, size_t iter, size_t num_iters, double elapsed_in_sec, double bandwidth)
+{
+    // Progress records are best effort: a missing or busy listener must never fail the test.
+    static int         socket_fd = -1;
+    static sockaddr_un address {};
+    static char        host_name[HOST_NAME_MAX_LEN] {};
+
+    if (!is_progress_enabled())
+    {
+        return;
+    }
+
+    if (socket_fd < 0)
+    {
+        string socket_path = get_demo_progress_socket();
+        if (socket_path.length() >= sizeof(address.sun_path))
+        {
+            return;
+        }
+        socket_fd = socket(AF_UNIX, SOCK_DGRAM, 0);
+        if (socket_fd < 0)
+        {
+            return;
+        }
+        address.sun_family = AF_UNIX;
+        socket_path.copy(address.sun_path, socket_path.length());
+        gethostname(host_name, HOST_NAME_MAX_LEN - 1);
+    }
+
+    int          hccl_rank = get_hccl_rank();
+    stringstream ss;
+    ss << fixed << setprecision(3);
+    ss << "{\"rank\": " << hccl_rank << ", \"module_id\": " << hccl_rank % get_demo_box_size() << ", \"host\": \""
+       << host_name << "\", \"test\": \"" << get_demo_test_type() << "\", \"size\": " << data_size
+       << ", \"phase\": \"" << phase << "\", \"iter\": " << iter << ", \"num_iters\": " << num_iters << ", \"elapsed\": " << elapsed_in_sec
+       << ", \"bandwidth\": " << bandwidth << "}";
+
+    string record = ss.str();
+    sendto(socket_fd, record.c_str(), record.length(), MSG_DONTWAIT, (sockaddr*) &address, sizeof(address));
+}
+
+hcclResult_t gather_rank_stats(hccl_demo_data& demo_data, hccl_demo_stats& stat)
+{
+    // Every rank shares its duration together with its module and node IDs, so that
+    // stragglers can be pointed at and not only averaged away.
+    int         hccl_rank            = get_hccl_rank();
+    auto        input_host_data      = vector<float> {stat.rank_duration_in_sec,
+                                              (float) (hccl_rank % get_demo_box_size()),
+                                              (float) get_demo_node_id()};
+    auto        output_host_data     = vector<float>(RANK_STAT_FIELDS * demo_data.nranks);
+    uint64_t    input_size           = input_host_data.size() * sizeof(float);
+    uint64_t    output_size          = output_host_data.size() * sizeof(float);
+    const void* input_host_data_ptr  = reinterpret_cast<void*>(input_host_data.data());
+    const void* output_host_data_ptr = reinterpret_cast<void*>(output_host_data.data());
+
+    uint64_t input_dev_ptr {};
+    uint64_t output_dev_ptr {};
+
+    CHECK_SYNAPSE_STATUS(synDeviceMalloc(demo_data.device_handle, input_size, 0, 0, &input_dev_ptr));
+    CHECK_SYNAPSE_STATUS(synDeviceMalloc(demo_data.device_handle, output_size, 0, 0, &output_dev_ptr));
+    CHECK_SYNAPSE_STATUS(synHostMap(demo_data.device_handle, input_size, input_host_data_ptr));
+    CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.host_to_device_stream,
+                                         (uint64_t) input_host_data_ptr,
+                                         input_size,
+                                         input_dev_ptr,
+                                         HOST_TO_DRAM));
+    CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.host_to_device_stream));
+    CHECK_HCCL_STATUS(hcclAllGather((const void*) input_dev_ptr,
+                                    (void*) output_dev_ptr,
+                                    input_host_data.size(),
+                                    hcclFloat32,
+                                    demo_data.hccl_comm,
+                                    demo_data.collective_stream));
+    CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.collective_stream));
+
+    CHECK_SYNAPSE_STATUS(synHostMap(demo_data.device_handle, output_size, output_host_data_ptr));
+    CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.device_to_host_stream,
+                                         output_dev_ptr,
+                                         output_size,
+                                         (uint64_t) output_host_data_ptr,
+                                         DRAM_TO_HOST));
+    CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.device_to_host_stream));
+
+    CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, input_host_data_ptr));
+    CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, output_host_data_ptr));
+    CHECK_SYNAPSE_STATUS(synDeviceFree(demo_data.device_handle, input_dev_ptr, 0));
+    CHECK_SYNAPSE_STATUS(synDeviceFree(demo_data.device_handle, output_dev_ptr, 0));
+
+    double total_duration = 0;
+    stat.rank_stats.clear();
+    for (size_t rank = 0; rank < demo_data.nranks; ++rank)
+    {
+        hccl_demo_rank_stat rank_stat;
+        rank_stat.rank            = rank;
+        rank_stat.duration_in_sec = output_host_data[rank * RANK_STAT_FIELDS];
+        rank_stat.module_id       = (int) output_host_data[rank * RANK_STAT_FIELDS + 1];
+        rank_stat.node_id         = (int) output_host_data[rank * RANK_STAT_FIELDS + 2];
+        total_duration += rank_stat.duration_in_sec;
+        stat.rank_stats.push_back(rank_stat);
+    }
+
+    stat.avg_duration_in_sec = total_duration / demo_data.nranks;
+
+    return hcclSuccess;
+}
+
+hccl_demo_stats benchmark(hccl_demo_data&         demo_data,
+                          size_t                  data_size,
+                          double                  factor,
+                          const function<void()>& fn)
+{
+    hccl_demo_stats stat;
+    auto            num_warmup_iters = size_t {NUMBER_OF_WARMUPS};
+    bool            report_enabled   = is_progress_enabled();
+    auto            phase_start_time = Clock::now();
+    auto            last_report_time = phase_start_time;
+    auto            last_report_iter = size_t {0};
+
+    // The stream is synchronized only once per reporting interval, so that the
+    // reported iterations are completed ones and not just enqueued ones.
+    auto report_iteration = [&](const string& phase, size_t iter, size_t num_iters) {
+        if (report_enabled && to_seconds(Clock::now() - last_report_time) >= get_demo_progress_interval())
+        {
+            CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.collective_stream));
+            auto   now              = Clock::now();
+            double window_in_sec    = to_seconds(now - last_report_time);
+            size_t window_iters     = iter + 1 - last_report_iter;
+            double rolling_bandwith = (double) data_size * window_iters / window_in_sec * factor;
+            report_progress(phase, data_size, iter + 1, num_iters, to_seconds(now - phase_start_time), rolling_bandwith);
+            last_report_time = now;
+            last_report_iter = iter + 1;
+        }
+    };
+
+    // Warmup run
+    report_progress("warmup", data_size, 0, num_warmup_iters, 0, 0);
+
+    for (size_t iter = 0; iter < num_warmup_iters; ++iter)
+    {
+        fn();
+        report_iteration("warmup", iter, num_warmup_iters);
+    }
+
+    CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.collective_stream));
+
+    // Actual iterations
+    auto start_time  = Clock::now();
+    phase_start_time = start_time;
+    last_report_time = start_time;
+    last_report_iter = 0;
+
+    report_progress("loop", data_size, 0, demo_data.num_iters, 0, 0);
+
+    for (size_t iter = 0; iter < demo_data.num_iters; ++iter)
+    {
+        fn();
+        report_iteration("loop", iter, demo_data.num_iters);
+    }
+
+    CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.collective_stream));
+
+    auto duration             = Clock::now() - start_time;
+    stat.rank_duration_in_sec = to_seconds(duration);
+    stat.rank_duration_in_sec = stat.rank_duration_in_sec / demo_data.num_iters;
+    double bandwidth          = (double) data_size / stat.rank_duration_in_sec * factor;
+
+    // The rank stats all-gather may hang as well, therefore the rank is reported as done only
+    // once it has left the all-gather of the last tested size.
+    report_progress("gather", data_size, demo_data.num_iters, demo_data.num_iters, to_seconds(duration), bandwidth);
+
+    CHECK_HCCL_STATUS(gather_rank_stats(demo_data, stat));
+
+    report_progress(data_size == get_demo_test_sizes().back() ? "done" : "check",
+                    data_size,
+                    demo_data.num_iters,
+                    demo_data.num_iters,
+                    to_seconds(duration),
+                    bandwidth);
+
+    return stat;
+}
+
+string describe_rank(const hccl_demo_rank_stat& rank_stat)
+{
+    return "rank " + to_string(rank_stat.rank) + " (module " + to_string(rank_stat.module_id) + ", node " +
+           to_string(rank_stat.node_id) + ")";
+}
+
+string describe_imbalance(const hccl_demo_stats& stats)
+{
+    stringstream ss;
+
+    if (stats.rank_stats.empty())
+    {
+        return ss.str();
+    }
+
+    // Sort from the slowest rank to the fastest one
+    auto rank_stats = stats.rank_stats;
+    stable_sort(rank_stats.begin(), rank_stats.end(), [](const hccl_demo_rank_stat& a, const hccl_demo_rank_stat& b) {
+        return a.duration_in_sec > b.duration_in_sec;
+    });
+    const auto& slowest = rank_stats.front();
+    const auto& fastest = rank_stats.back();
+
+    ss << fixed << setprecision(3);
+    ss << "[BENCHMARK]     Fastest rank  : " << format_duration(fastest.duration_in_sec) << " per iteration, "
+       << describe_rank(fastest) << '\n';
+    ss << "[BENCHMARK]     Slowest rank  : " << format_duration(slowest.duration_in_sec) << " per iteration, "
+       << describe_rank(slowest) << '\n';
+    ss << "[BENCHMARK]     Imbalance     : max/min " << slowest.duration_in_sec / fastest.duration_in_sec << ", max/avg "
+       << slowest.duration_in_sec / stats.avg_duration_in_sec << '\n';
+
+    size_t num_slowest = min(get_demo_slowest_ranks(), rank_stats.size());
+    if (num_slowest > 0)
+    {
+        ss << "[BENCHMARK]     Slowest ranks :" << '\n';
+        ss << setprecision(1);
+        for (size_t i = 0; i < num_slowest; ++i)
+        {
+            double deviation = (rank_stats[i].duration_in_sec / stats.avg_duration_in_sec - 1) * 100;
+            ss << "[BENCHMARK]         " << describe_rank(rank_stats[i]) << " : "
+               << format_duration(rank_stats[i].duration_in_sec) << " (" << showpos << deviation << noshowpos
+               << "% vs avg)" << '\n';
+        }
+    }
+    return ss.str();
+}
+
+void write_summary(const hccl_demo_stats& stats,
+                   size_t                 data_size,
+                   double                 factor,
+                   int                    loop,
+                   const string&          test_type,
+                   const string&          dtype)
+{
+    // One JSON record per tested size, consumed by the scenario runner of run_hccl_demo.py
+    auto summary_path = get_demo_summary_path();
+    if (summary_path.empty() || stats.rank_stats.empty())
+    {
+        return;
+    }
+
+    auto compare = [](const hccl_demo_rank_stat& a, const hccl_demo_rank_stat& b) {
+        return a.duration_in_sec < b.duration_in_sec;
+    };
+    const auto& fastest = *min_element(stats.rank_stats.begin(), stats.rank_stats.end(), compare);
+    const auto& slowest = *max_element(stats.rank_stats.begin(), stats.rank_stats.end(), compare);
+
+    ofstream output;
+    output.open(summary_path, ofstream::out | ofstream::app);
+    output << setprecision(9);
+    output << "{\"test\": \"" << test_type << "\", \"dtype\": \"" << dtype << "\", \"size\": " << data_size
+           << ", \"loop\": " << loop << ", \"nranks\": " << stats.rank_stats.size()
+           << ", \"bandwidth\": " << (double) data_size / stats.avg_duration_in_sec * factor
+           << ", \"avg_duration\": " << stats.avg_duration_in_sec << ", \"min_duration\": " << fastest.duration_in_sec
+           << ", \"min_rank\": " << fastest.rank << ", \"max_duration\": " << slowest.duration_in_sec
+           << ", \"max_rank\": " << slowest.rank << ", \"max_module_id\": " << slowest.module_id
+           << ", \"max_node_id\": " << slowest.node_id << "}" << endl;
+    output.close();
+}
+
 void describe_stat(const string&          stat_name,
                    const hccl_demo_stats& stats,
                    size_t                 data_size,
@@ -344,9 +672,12 @@ void describe_stat(const string&          stat_name,
         size_t delimiter_size = stat_name.length() + string {"[BENCHMARK]"}.length() + 1;
         ss << get_print_delimiter(delimiter_size, '#') << '\n';
         ss << "[BENCHMARK] " << stat_name << '\n';
-        ss << "[BENCHMARK]     Bandwidth     : " << format_bw(avg_bandwidth);
-        ss << '\n' << get_print_delimiter(delimiter_size, '#') << '\n';
+        ss << "[BENCHMARK]     Bandwidth     : " << format_bw(avg_bandwidth) << '\n';
+        ss << describe_imbalance(stats);
+        ss << get_print_delimiter(delimiter_size, '#') << '\n';
         log() << ss.str();
+
+        write_summary(stats, data_size, factor, loop, test_type, dtype);
     }
 
     // Write results to csv file
@@ -374,84 +705,123 @@ hcclResult_t send_recv_test(
     return hcclSuccess;
 }
 
-int main()
+bool run_test(hccl_demo_data& demo_data, int hccl_rank, uint64_t data_size)
 {
     bool is_ok = true;
-    try
-    {
-        log() << "Running HCCL Demo :: A simple program demonstrating HCCL usage from C++" << endl;
 
-        if (verify_mpi_configuration())
-        {
-            throw runtime_error {
-                "HCCL demo compilation and user instruction regarding run type (MPI/pure) are non compatible. \nPlease "
-                "consider to build the demo with the correct instructions or run with -clean"};
-        }
+    uint64_t input_dev_ptr {};
+    uint64_t output_dev_ptr {};
 
-#if MPI_ENABLED
-        log() << "MPI enabled. Make sure that HCCL demo is launched with mpirun." << std::endl;
-        // Initialize the Open MPI execution context.
-        CHECK_MPI_STATUS(MPI_Init(NULL, NULL));
-#endif  //MPI_ENABLED
+    // Allocate buffers on the HPU device
+    uint64_t    count               = data_size / sizeof(float);
+    auto        input_host_data     = vector<float>(count, hccl_rank + 1);
+    const void* input_host_data_ptr = reinterpret_cast<void*>(input_host_data.data());
 
-        hccl_demo_data demo_data;
-        demo_data.nranks    = get_nranks();
-        demo_data.num_iters = get_demo_test_loop();
-        int hccl_rank       = get_hccl_rank();
+    CHECK_SYNAPSE_STATUS(synDeviceMalloc(demo_data.device_handle, data_size, 0, 0, &input_dev_ptr));
+    CHECK_SYNAPSE_STATUS(synDeviceMalloc(demo_data.device_handle, data_size, 0, 0, &output_dev_ptr));
+    CHECK_SYNAPSE_STATUS(synHostMap(demo_data.device_handle, data_size, input_host_data_ptr));
+    CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.host_to_device_stream,
+                                         (uint64_t) input_host_data_ptr,
+                                         data_size,
+                                         input_dev_ptr,
+                                         HOST_TO_DRAM));
+    CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.host_to_device_stream));
 
-        // Initialize Synapse API context
-        CHECK_SYNAPSE_STATUS(synInitialize());
+    string test_type = get_demo_test_type();
 
-        // Acquire device
-        const synModuleId device_module_id = hccl_rank % get_demo_box_size();
-        CHECK_SYNAPSE_STATUS(synDeviceAcquireByModuleId(&demo_data.device_handle, device_module_id));
+    if (test_type == "broadcast")
+    {
+        double broadcast_factor = 1;
+        int    root             = get_demo_test_root();
 
-#if AFFINITY_ENABLED
-        if (setupAffinity(device_module_id) != 0)
+        for (uint64_t i = 0; i < count; ++i)
         {
-            throw runtime_error {"Affinity setting for HCCL demo failed."};
+            input_host_data[i] = i + hccl_rank;
         }
-#endif
-        // Create Streams
-        CHECK_SYNAPSE_STATUS(
-            synStreamCreate(&demo_data.collective_stream, demo_data.device_handle, STREAM_TYPE_NETWORK_COLLECTIVE, 0));
-        CHECK_SYNAPSE_STATUS(synStreamCreate(&demo_data.device_to_host_stream,
-                                             demo_data.device_handle,
-                                             STREAM_TYPE_COPY_DEVICE_TO_HOST,
-                                             0));
-        CHECK_SYNAPSE_STATUS(synStreamCreate(&demo_data.host_to_device_stream,
-                                             demo_data.device_handle,
-                                             STREAM_TYPE_COPY_HOST_TO_DEVICE,
-                                             0));
 
-        // Generate unique id
-        hcclUniqueId  unique_id {};
-        constexpr int master_mpi_rank = 0;
+        // Copy from input_host_data_ptr to input_dev_ptr (to be used in benchmark)
+        CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.host_to_device_stream,
+                                             (uint64_t) input_host_data_ptr,
+                                             data_size,
+                                             input_dev_ptr,
+                                             HOST_TO_DRAM));
 
-        if (hccl_rank == master_mpi_rank)
+        CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.host_to_device_stream));
+
+        // Run HCCL Broadcast collective
+        auto stat = benchmark(demo_data, data_size, broadcast_factor, [&]() {
+            CHECK_HCCL_STATUS(hcclBroadcast((const void*) input_dev_ptr,
+                                            (void*) output_dev_ptr,
+                                            input_host_data.size(),
+                                            hcclFloat32,
+                                            root,
+                                            demo_data.hccl_comm,
+                                            demo_data.collective_stream));
+        });
+
+        // Correctness check
+
+        auto        output_host_data     = vector<float>(input_host_data.size());
+        const void* output_host_data_ptr = reinterpret_cast<void*>(output_host_data.data());
+
+        CHECK_SYNAPSE_STATUS(synHostMap(demo_data.device_handle, data_size, output_host_data_ptr));
+        CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.device_to_host_stream,
+                                             output_dev_ptr,
+                                             data_size,
+                                             (uint64_t) output_host_data_ptr,
+                                             DRAM_TO_HOST));
+        CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.device_to_host_stream));
+
+        for (size_t i = 0; i < input_host_data.size(); ++i)
         {
-            CHECK_HCCL_STATUS(hcclGetUniqueId(&unique_id));
+            if (abs(output_host_data[i] - (float) (i + root)) != 0)
+            {
+                is_ok = false;
+            }
         }
 
-#if MPI_ENABLED
-        CHECK_MPI_STATUS(MPI_Bcast(&unique_id, sizeof(unique_id), MPI_BYTE, master_mpi_rank, MPI_COMM_WORLD));
-#endif  // MPI_ENABLED
-
-        // Create new HCCL communicator
-        CHECK_HCCL_STATUS(hcclCommInitRank(&demo_data.hccl_comm, demo_data.nranks, unique_id, hccl_rank));
+        log() << "Broadcast hccl_rank=" << hccl_rank << " root=" << root << " size=" << data_size << " <float>"
+              << " Input Buffer [" << input_host_data[0] << " " << input_host_data[1] << " " << input_host_data[2]
+              << " " << input_host_data[3] << " ...]"
+              << " Output Buffer [" << output_host_data[0] << " " << output_host_data[1] << " "
+              << output_host_data[2] << " " << output_host_data[3] << " ...]"
+              << " which is " << (is_ok ? "fine." : "bad.") << endl;
+
+        CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, input_host_data_ptr));
+        CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, output_host_data_ptr));
+
+        // End of correctness check
+
+        describe_stat("Broadcast(count=" + to_string(input_host_data.size()) +
+                          ", dtype=fp32, iterations=" + to_string(demo_data.num_iters) + ")",
+                      stat,
+                      data_size,
+                      broadcast_factor,
+                      hccl_rank,
+                      demo_data.num_iters,
+                      test_type,
+                      "float");
+    }
+    else if (test_type == "all_reduce")
+    {
+        double allreduce_factor = ((double) (2 * (demo_data.nranks - 1))) / ((double) demo_data.nranks);
 
-        uint64_t input_dev_ptr {};
-        uint64_t output_dev_ptr {};
+        // Fill input data, example:
+        // Input        |   Output
+        // G0 G1 G2 G3      G0 G1 G2 G3
+        // 0  1  2  3   =>  6  6  6  6
+        // 4  5  6  7       22 22 22 22
+        // 8  9  10 11      38 38 38 38
+        // 12 13 14 15      54 54 54 54
 
-        // Allocate buffers on the HPU device
-        uint64_t    data_size           = get_demo_test_size();
-        uint64_t    count               = data_size / sizeof(float);
-        auto        input_host_data     = vector<float>(count, hccl_rank + 1);
-        const void* input_host_data_ptr = reinterpret_cast<void*>(input_host_data.data());
+        for (uint64_t i = 0; i < count; ++i)
+        {
+            // We want to make sure we use different values on each cell and between ranks,
+            // but we don't want the summation to get too big, that is why we modulo by DATA_ELEMENTS_MAX.
+            input_host_data[i] = hccl_rank + (demo_data.nranks * (i % DATA_ELEMENTS_MAX));
+        }
 
-        CHECK_SYNAPSE_STATUS(synDeviceMalloc(demo_data.device_handle, data_size, 0, 0, &input_dev_ptr));
-        CHECK_SYNAPSE_STATUS(synDeviceMalloc(demo_data.device_handle, data_size, 0, 0, &output_dev_ptr));
-        CHECK_SYNAPSE_STATUS(synHostMap(demo_data.device_handle, data_size, input_host_data_ptr));
+        //Copy from input_host_data_ptr to input_dev_ptr (to be used in benchmark)
         CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.host_to_device_stream,
                                              (uint64_t) input_host_data_ptr,
                                              data_size,
@@ -459,396 +829,446 @@ int main()
                                              HOST_TO_DRAM));
         CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.host_to_device_stream));
 
-        string test_type = get_demo_test_type();
+        // Run HCCL AllReduce collective
+        auto stat = benchmark(demo_data, data_size, allreduce_factor, [&]() {
+            CHECK_HCCL_STATUS(hcclAllReduce((const void*) input_dev_ptr,
+                                            (void*) output_dev_ptr,
+                                            input_host_data.size(),
+                                            hcclFloat32,
+                                            hcclSum,
+                                            demo_data.hccl_comm,
+                                            demo_data.collective_stream));
+        });
+
+        // Correctness check
+
+        auto        output_host_data     = vector<float>(input_host_data.size());
+        const void* output_host_data_ptr = reinterpret_cast<void*>(output_host_data.data());
+
+        CHECK_SYNAPSE_STATUS(synHostMap(demo_data.device_handle, data_size, output_host_data_ptr));
+        CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.device_to_host_stream,
+                                             output_dev_ptr,
+                                             data_size,
+                                             (uint64_t) output_host_data_ptr,
+                                             DRAM_TO_HOST));
+        CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.device_to_host_stream));
+
+        int start = 0;
+        int end   = demo_data.nranks - 1;
+        int expected;
+        int addCommSize;
 
-        if (test_type == "broadcast")
+        for (size_t i = 0; i < input_host_data.size(); ++i)
         {
-            double broadcast_factor = 1;
-            int    root             = get_demo_test_root();
+            addCommSize = demo_data.nranks * (i % DATA_ELEMENTS_MAX);
 
-            for (uint64_t i = 0; i < count; ++i)
+            // Arithmetic progression
+            expected = ((start + addCommSize) + (end + addCommSize)) * demo_data.nranks / 2;
+            if (abs(output_host_data[i] - expected) != 0)
             {
-                input_host_data[i] = i + hccl_rank;
+                is_ok = false;
             }
+        }
+        log() << "Allreduce hccl_rank=" << hccl_rank << " size=" << data_size << " <float>"
+              << " Input Buffer [" << input_host_data[0] << " " << input_host_data[1] << " " << input_host_data[2]
+              << " " << input_host_data[3] << " ...]"
+              << " reduced to Output Buffer [" << output_host_data[0] << " " << output_host_data[1] << " "
+              << output_host_data[2] << " " << output_host_data[3] << " ...]"
+              << " which is " << (is_ok ? "fine." : "bad.") << endl;
+
+        CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, input_host_data_ptr));
+        CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, output_host_data_ptr));
+
+        // End of correctness check
+
+        describe_stat("hcclAllReduce(src!=dst, count=" + to_string(input_host_data.size()) +
+                          ", dtype=fp32, iterations=" + to_string(demo_data.num_iters) + ")",
+                      stat,
+                      data_size,
+                      allreduce_factor,
+                      hccl_rank,
+                      demo_data.num_iters,
+                      test_type,
+                      "float");
+    }
+    else if (test_type == "reduce_scatter")
+    {
+        double reduce_scatter_factor = ((double) (demo_data.nranks - 1)) / ((double) demo_data.nranks);
 
-            // Copy from input_host_data_ptr to input_dev_ptr (to be used in benchmark)
-            CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.host_to_device_stream,
-                                                 (uint64_t) input_host_data_ptr,
-                                                 data_size,
-                                                 input_dev_ptr,
-                                                 HOST_TO_DRAM));
+        // Fill input data, example:
+        // Input        |   Output
+        // G0 G1 G2 G3      G0 G1 G2 G3
+        // 0  1  2  3   =>  6  22 38 54
+        // 4  5  6  7
+        // 8  9  10 11
+        // 12 13 14 15
 
-            CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.host_to_device_stream));
+        for (uint64_t i = 0; i < count; ++i)
+        {
+            // We want to make sure we use different values on each cell and between ranks,
+            // but we don't want the summation to get too big, that is why we modulo by DATA_ELEMENTS_MAX.
+            input_host_data[i] = hccl_rank + (demo_data.nranks * (i % DATA_ELEMENTS_MAX));
+        }
+
+        //Copy from input_host_data_ptr to input_dev_ptr (to be used in benchmark)
+        CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.host_to_device_stream,
+                                             (uint64_t) input_host_data_ptr,
+                                             data_size,
+                                             input_dev_ptr,
+                                             HOST_TO_DRAM));
+        CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.host_to_device_stream));
 
-            // Run HCCL Broadcast collective
-            auto stat = benchmark(demo_data, [&]() {
-                CHECK_HCCL_STATUS(hcclBroadcast((const void*) input_dev_ptr,
+        // Run HCCL ReduceScatter collective
+        auto stat = benchmark(demo_data, data_size, reduce_scatter_factor, [&]() {
+            CHECK_HCCL_STATUS(hcclReduceScatter((const void*) input_dev_ptr,
                                                 (void*) output_dev_ptr,
-                                                input_host_data.size(),
+                                                input_host_data.size() / demo_data.nranks,
                                                 hcclFloat32,
-                                                root,
+                                                hcclSum,
                                                 demo_data.hccl_comm,
                                                 demo_data.collective_stream));
-            });
-
-            // Correctness check
-
-            auto        output_host_data     = vector<float>(input_host_data.size());
-            const void* output_host_data_ptr = reinterpret_cast<void*>(output_host_data.data());
+        });
 
-            CHECK_SYNAPSE_STATUS(synHostMap(demo_data.device_handle, data_size, output_host_data_ptr));
-            CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.device_to_host_stream,
-                                                 output_dev_ptr,
-                                                 data_size,
-                                                 (uint64_t) output_host_data_ptr,
-                                                 DRAM_TO_HOST));
-            CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.device_to_host_stream));
+        // Correctness check
+        auto        output_host_data     = vector<float>(input_host_data.size() / demo_data.nranks);
+        const void* output_host_data_ptr = reinterpret_cast<void*>(output_host_data.data());
 
-            for (size_t i = 0; i < input_host_data.size(); ++i)
-            {
-                if (abs(output_host_data[i] - (float) (i + root)) != 0)
-                {
-                    is_ok = false;
-                }
-            }
-
-            log() << "Broadcast hccl_rank=" << hccl_rank << " root=" << root << " size=" << data_size << " <float>"
-                  << " Input Buffer [" << input_host_data[0] << " " << input_host_data[1] << " " << input_host_data[2]
-                  << " " << input_host_data[3] << " ...]"
-                  << " Output Buffer [" << output_host_data[0] << " " << output_host_data[1] << " "
-                  << output_host_data[2] << " " << output_host_data[3] << " ...]"
-                  << " which is " << (is_ok ? "fine." : "bad.") << endl;
-
-            CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, input_host_data_ptr));
-            CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, output_host_data_ptr));
-
-            // End of correctness check
-
-            describe_stat("Broadcast(count=" + to_string(input_host_data.size()) +
-                              ", dtype=fp32, iterations=" + to_string(demo_data.num_iters) + ")",
-                          stat,
-                          data_size,
-                          broadcast_factor,
-                          hccl_rank,
-                          demo_data.num_iters,
-                          test_type,
-                          "float");
-        }
-        else if (test_type == "all_reduce")
+        CHECK_SYNAPSE_STATUS(
+            synHostMap(demo_data.device_handle, data_size / demo_data.nranks, output_host_data_ptr));
+        CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.device_to_host_stream,
+                                             output_dev_ptr,
+                                             data_size / demo_data.nranks,
+                                             (uint64_t) output_host_data_ptr,
+                                             DRAM_TO_HOST));
+        CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.device_to_host_stream));
+
+        int start;
+        int end;
+        int expected = 0;
+
+        for (size_t i = 0; i < output_host_data.size(); ++i)
         {
-            double allreduce_factor = ((double) (2 * (demo_data.nranks - 1))) / ((double) demo_data.nranks);
-
-            // Fill input data, example:
-            // Input        |   Output
-            // G0 G1 G2 G3      G0 G1 G2 G3
-            // 0  1  2  3   =>  6  6  6  6
-            // 4  5  6  7       22 22 22 22
-            // 8  9  10 11      38 38 38 38
-            // 12 13 14 15      54 54 54 54
-
-            for (uint64_t i = 0; i < count; ++i)
+            start = (hccl_rank * output_host_data.size()) % DATA_ELEMENTS_MAX * demo_data.nranks;
+            end   = start + (demo_data.nranks - 1);
+            // Arithmetic progression
+            expected = (((start + demo_data.nranks * i) % (demo_data.nranks * DATA_ELEMENTS_MAX)) +
+                        ((end + demo_data.nranks * i) % (demo_data.nranks * DATA_ELEMENTS_MAX))) *
+                       demo_data.nranks / 2;
+            if (abs(output_host_data[i] - expected) != 0)
             {
-                // We want to make sure we use different values on each cell and between ranks,
-                // but we don't want the summation to get too big, that is why we modulo by DATA_ELEMENTS_MAX.
-                input_host_data[i] = hccl_rank + (demo_data.nranks * (i % DATA_ELEMENTS_MAX));
+                is_ok = false;
             }
+        }
 
-            //Copy from input_host_data_ptr to input_dev_ptr (to be used in benchmark)
-            CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.host_to_device_stream,
-                                                 (uint64_t) input_host_data_ptr,
-                                                 data_size,
-                                                 input_dev_ptr,
-                                                 HOST_TO_DRAM));
-            CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.host_to_device_stream));
+        log() << "ReduceScatter hccl_rank=" << hccl_rank << " size=" << data_size << " <float>"
+              << " Input Buffer [" << input_host_data[0] << " " << input_host_data[1] << " " << input_host_data[2]
+              << " " << input_host_data[3] << " ...]"
+              << " reduced to Output Buffer [" << output_host_data[0] << " " << output_host_data[1] << " "
+              << output_host_data[2] << " " << output_host_data[3] << " ...]"
+              << " which is " << (is_ok ? "fine." : "bad.") << endl;
+
+        CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, input_host_data_ptr));
+        CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, output_host_data_ptr));
+
+        // End of correctness
+
+        describe_stat("hcclReduceScatter(src!=dst, count=" + to_string(input_host_data.size()) +
+                          ", dtype=fp32, iterations=" + to_string(demo_data.num_iters) + ")",
+                      stat,
+                      data_size,
+                      reduce_scatter_factor,
+                      hccl_rank,
+                      demo_data.num_iters,
+                      test_type,
+                      "float");
+    }
+    else if (test_type == "all_gather")
+    {
+        double all_gather_factor = ((double) (demo_data.nranks - 1));
+        CHECK_SYNAPSE_STATUS(synDeviceFree(demo_data.device_handle, output_dev_ptr, 0));
+        CHECK_SYNAPSE_STATUS(
+            synDeviceMalloc(demo_data.device_handle, data_size * demo_data.nranks, 0, 0, &output_dev_ptr));
+
+        // Fill input data, example:
+        // Input        |   Output
+        // G0 G1 G2 G3      G0 G1 G2 G3
+        // 0  2  4  6   =>  0  0  0  0
+        // 1  3  5  7       1  1  1  1
+        //                  2  2  2  2
+        //                  3  3  3  3
+        //                  4  4  4  4
+        //                  5  5  5  5
+        //                  6  6  6  6
+        //                  7  7  7  7
+
+        for (uint64_t i = 0; i < count; ++i)
+        {
+            input_host_data[i] = hccl_rank * count + i;
+        }
 
-            // Run HCCL AllReduce collective
-            auto stat = benchmark(demo_data, [&]() {
-                CHECK_HCCL_STATUS(hcclAllReduce((const void*) input_dev_ptr,
-                                                (void*) output_dev_ptr,
-                                                input_host_data.size(),
-                                                hcclFloat32,
-                                                hcclSum,
-                                                demo_data.hccl_comm,
-                                                demo_data.collective_stream));
-            });
+        //Copy from input_host_data_ptr to input_dev_ptr (to be used in benchmark)
+        CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.host_to_device_stream,
+                                             (uint64_t) input_host_data_ptr,
+                                             data_size,
+                                             input_dev_ptr,
+                                             HOST_TO_DRAM));
 
-            // Correctness check
+        CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.host_to_device_stream));
 
-            auto        output_host_data     = vector<float>(input_host_data.size());
-            const void* output_host_data_ptr = reinterpret_cast<void*>(output_host_data.data());
+        // Run HCCL AllGather collective
+        auto stat = benchmark(demo_data, data_size, all_gather_factor, [&]() {
+            CHECK_HCCL_STATUS(hcclAllGather((const void*) input_dev_ptr,
+                                            (void*) output_dev_ptr,
+                                            input_host_data.size(),
+                                            hcclFloat32,
+                                            demo_data.hccl_comm,
+                                            demo_data.collective_stream));
+        });
 
-            CHECK_SYNAPSE_STATUS(synHostMap(demo_data.device_handle, data_size, output_host_data_ptr));
-            CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.device_to_host_stream,
-                                                 output_dev_ptr,
-                                                 data_size,
-                                                 (uint64_t) output_host_data_ptr,
-                                                 DRAM_TO_HOST));
-            CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.device_to_host_stream));
+        // Correctness check
 
-            int start = 0;
-            int end   = demo_data.nranks - 1;
-            int expected;
-            int addCommSize;
+        auto        output_host_data     = vector<float>(input_host_data.size() * demo_data.nranks);
+        const void* output_host_data_ptr = reinterpret_cast<void*>(output_host_data.data());
 
-            for (size_t i = 0; i < input_host_data.size(); ++i)
+        CHECK_SYNAPSE_STATUS(
+            synHostMap(demo_data.device_handle, data_size * demo_data.nranks, output_host_data_ptr));
+        CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.device_to_host_stream,
+                                             output_dev_ptr,
+                                             data_size * demo_data.nranks,
+                                             (uint64_t) output_host_data_ptr,
+                                             DRAM_TO_HOST));
+        CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.device_to_host_stream));
+
+        for (size_t i = 0; i < output_host_data.size(); ++i)
+        {
+            if (output_host_data[i] != i)
             {
-                addCommSize = demo_data.nranks * (i % DATA_ELEMENTS_MAX);
-
-                // Arithmetic progression
-                expected = ((start + addCommSize) + (end + addCommSize)) * demo_data.nranks / 2;
-                if (abs(output_host_data[i] - expected) != 0)
-                {
-                    is_ok = false;
-                }
+                is_ok = false;
             }
-            log() << "Allreduce hccl_rank=" << hccl_rank << " size=" << data_size << " <float>"
-                  << " Input Buffer [" << input_host_data[0] << " " << input_host_data[1] << " " << input_host_data[2]
-                  << " " << input_host_data[3] << " ...]"
-                  << " reduced to Output Buffer [" << output_host_data[0] << " " << output_host_data[1] << " "
-                  << output_host_data[2] << " " << output_host_data[3] << " ...]"
-                  << " which is " << (is_ok ? "fine." : "bad.") << endl;
-
-            CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, input_host_data_ptr));
-            CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, output_host_data_ptr));
-
-            // End of correctness check
-
-            describe_stat("hcclAllReduce(src!=dst, count=" + to_string(input_host_data.size()) +
-                              ", dtype=fp32, iterations=" + to_string(demo_data.num_iters) + ")",
-                          stat,
-                          data_size,
-                          allreduce_factor,
-                          hccl_rank,
-                          demo_data.num_iters,
-                          test_type,
-                          "float");
         }
-        else if (test_type == "reduce_scatter")
-        {
-            double reduce_scatter_factor = ((double) (demo_data.nranks - 1)) / ((double) demo_data.nranks);
-
-            // Fill input data, example:
-            // Input        |   Output
-            // G0 G1 G2 G3      G0 G1 G2 G3
-            // 0  1  2  3   =>  6  22 38 54
-            // 4  5  6  7
-            // 8  9  10 11
-            // 12 13 14 15
 
-            for (uint64_t i = 0; i < count; ++i)
+        log() << "AllGather hccl_rank=" << hccl_rank << " size=" << data_size << " <float>"
+              << " Input Buffer [" << input_host_data[0] << " " << input_host_data[1] << " " << input_host_data[2]
+              << " " << input_host_data[3] << " ...]"
+              << " gathered to Output Buffer [" << output_host_data[0] << " " << output_host_data[1] << " "
+              << output_host_data[2] << " " << output_host_data[3] << " ...]"
+              << " which is " << (is_ok ? "fine." : "bad.") << endl;
+
+        CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, input_host_data_ptr));
+        CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, output_host_data_ptr));
+
+        // End of correctness check
+
+        describe_stat("hcclAllGather(src!=dst, count=" + to_string(input_host_data.size()) +
+                          ", dtype=fp32, iterations=" + to_string(demo_data.num_iters) + ")",
+                      stat,
+                      data_size,
+                      all_gather_factor,
+                      hccl_rank,
+                      demo_data.num_iters,
+                      test_type,
+                      "float");
+    }
+    else if (test_type == "all2all")
+    {
+        double all2all_factor = ((double) (demo_data.nranks - 1)) / ((double) demo_data.nranks);
+
+        // Fill input data, example:
+        // Input        |   Output
+        // G0 G1 G2 G3      G0 G1 G2 G3
+        // 0  2  4  6   =>  0  4  8  12
+        // 1  3  5  7       1  5  9  13
+        // 4  5  8  10      2  6  10 14
+        // 5  6  9  11      3  7  11 15
+        // 8  10 12 14      4  8  12 16
+        // 9  11 13 15      5  9  13 17
+        // 12 14 16 18      6  10 14 18
+        // 13 15 17 19      7  11 15 19
+        uint64_t chunkSize = count / demo_data.nranks;
+        for (uint64_t i = 0; i < count / chunkSize; ++i)
+        {
+            // We want to make sure we use different values on each cell and between ranks,
+            // but we don't want the summation to get too big, that is why we modulo by DATA_ELEMENTS_MAX.
+            for (uint64_t j = 0; j < chunkSize; ++j)
             {
-                // We want to make sure we use different values on each cell and between ranks,
-                // but we don't want the summation to get too big, that is why we modulo by DATA_ELEMENTS_MAX.
-                input_host_data[i] = hccl_rank + (demo_data.nranks * (i % DATA_ELEMENTS_MAX));
+                int val                            = hccl_rank * chunkSize + j + demo_data.nranks * i;
+                input_host_data[i * chunkSize + j] = (val % DATA_ELEMENTS_MAX);
             }
+        }
 
-            //Copy from input_host_data_ptr to input_dev_ptr (to be used in benchmark)
-            CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.host_to_device_stream,
-                                                 (uint64_t) input_host_data_ptr,
-                                                 data_size,
-                                                 input_dev_ptr,
-                                                 HOST_TO_DRAM));
-            CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.host_to_device_stream));
-
-            // Run HCCL ReduceScatter collective
-            auto stat = benchmark(demo_data, [&]() {
-                CHECK_HCCL_STATUS(hcclReduceScatter((const void*) input_dev_ptr,
-                                                    (void*) output_dev_ptr,
-                                                    input_host_data.size() / demo_data.nranks,
-                                                    hcclFloat32,
-                                                    hcclSum,
-                                                    demo_data.hccl_comm,
-                                                    demo_data.collective_stream));
-            });
-
-            // Correctness check
-            auto        output_host_data     = vector<float>(input_host_data.size() / demo_data.nranks);
-            const void* output_host_data_ptr = reinterpret_cast<void*>(output_host_data.data());
-
-            CHECK_SYNAPSE_STATUS(
-                synHostMap(demo_data.device_handle, data_size / demo_data.nranks, output_host_data_ptr));
-            CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.device_to_host_stream,
-                                                 output_dev_ptr,
-                                                 data_size / demo_data.nranks,
-                                                 (uint64_t) output_host_data_ptr,
-                                                 DRAM_TO_HOST));
-            CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.device_to_host_stream));
+        // Copy from input_host_data_ptr to input_dev_ptr (to be used in benchmark)
+        CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.host_to_device_stream,
+                                             (uint64_t) input_host_data_ptr,
+                                             data_size,
+                                             input_dev_ptr,
+                                             HOST_TO_DRAM));
+        CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.host_to_device_stream));
 
-            int start;
-            int end;
-            int expected = 0;
+        // Run HCCL AlltoAll collective
+        auto stat = benchmark(demo_data, data_size, all2all_factor, [&]() {
+            CHECK_HCCL_STATUS(hcclAlltoAll((const void*) input_dev_ptr,
+                                           (void*) output_dev_ptr,
+                                           input_host_data.size(),
+                                           hcclFloat32,
+                                           demo_data.hccl_comm,
+                                           demo_data.collective_stream));
+        });
+
+        // Correctness check
+        auto        output_host_data     = vector<float>(input_host_data.size());
+        const void* output_host_data_ptr = reinterpret_cast<void*>(output_host_data.data());
+
+        CHECK_SYNAPSE_STATUS(synHostMap(demo_data.device_handle, data_size, output_host_data_ptr));
+        CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.device_to_host_stream,
+                                             output_dev_ptr,
+                                             data_size,
+                                             (uint64_t) output_host_data_ptr,
+                                             DRAM_TO_HOST));
+        CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.device_to_host_stream));
 
-            for (size_t i = 0; i < output_host_data.size(); ++i)
-            {
-                start = (hccl_rank * output_host_data.size()) % DATA_ELEMENTS_MAX * demo_data.nranks;
-                end   = start + (demo_data.nranks - 1);
-                // Arithmetic progression
-                expected = (((start + demo_data.nranks * i) % (demo_data.nranks * DATA_ELEMENTS_MAX)) +
-                            ((end + demo_data.nranks * i) % (demo_data.nranks * DATA_ELEMENTS_MAX))) *
-                           demo_data.nranks / 2;
-                if (abs(output_host_data[i] - expected) != 0)
-                {
-                    is_ok = false;
-                }
-            }
+        int start = hccl_rank * (count / chunkSize);
+        int expected;
 
-            log() << "ReduceScatter hccl_rank=" << hccl_rank << " size=" << data_size << " <float>"
-                  << " Input Buffer [" << input_host_data[0] << " " << input_host_data[1] << " " << input_host_data[2]
-                  << " " << input_host_data[3] << " ...]"
-                  << " reduced to Output Buffer [" << output_host_data[0] << " " << output_host_data[1] << " "
-                  << output_host_data[2] << " " << output_host_data[3] << " ...]"
-                  << " which is " << (is_ok ? "fine." : "bad.") << endl;
-
-            CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, input_host_data_ptr));
-            CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, output_host_data_ptr));
-
-            // End of correctness
-
-            describe_stat("hcclReduceScatter(src!=dst, count=" + to_string(input_host_data.size()) +
-                              ", dtype=fp32, iterations=" + to_string(demo_data.num_iters) + ")",
-                          stat,
-                          data_size,
-                          reduce_scatter_factor,
-                          hccl_rank,
-                          demo_data.num_iters,
-                          test_type,
-                          "float");
-        }
-        else if (test_type == "all_gather")
+        for (size_t i = 0; i < output_host_data.size(); ++i)
         {
-            double all_gather_factor = ((double) (demo_data.nranks - 1));
-            CHECK_SYNAPSE_STATUS(
-                synDeviceMalloc(demo_data.device_handle, data_size * demo_data.nranks, 0, 0, &output_dev_ptr));
-
-            // Fill input data, example:
-            // Input        |   Output
-            // G0 G1 G2 G3      G0 G1 G2 G3
-            // 0  2  4  6   =>  0  0  0  0
-            // 1  3  5  7       1  1  1  1
-            //                  2  2  2  2
-            //                  3  3  3  3
-            //                  4  4  4  4
-            //                  5  5  5  5
-            //                  6  6  6  6
-            //                  7  7  7  7
-
-            for (uint64_t i = 0; i < count; ++i)
+            expected = ((start + i) % DATA_ELEMENTS_MAX);
+            if ((float) output_host_data[i] != (float) expected)
             {
-                input_host_data[i] = hccl_rank * count + i;
+                is_ok = false;
             }
+        }
 
-            //Copy from input_host_data_ptr to input_dev_ptr (to be used in benchmark)
-            CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.host_to_device_stream,
-                                                 (uint64_t) input_host_data_ptr,
-                                                 data_size,
-                                                 input_dev_ptr,
-                                                 HOST_TO_DRAM));
+        log() << "All2All hccl_rank=" << hccl_rank << " size=" << data_size << " <float>"
+              << " Input Buffer [" << input_host_data[0] << " " << input_host_data[1] << " " << input_host_data[2]
+              << " " << input_host_data[3] << " ...]"
+              << " distributed to Output Buffer [" << output_host_data[0] << " " << output_host_data[1] << " "
+              << output_host_data[2] << " " << output_host_data[3] << " ...]"
+              << " which is " << (is_ok ? "fine." : "bad.") << endl;
+
+        CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, input_host_data_ptr));
+        CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, output_host_data_ptr));
+
+        // End of correctness check
+
+        describe_stat("hcclAlltoAll(src!=dst, count=" + to_string(input_host_data.size()) +
+                          ", dtype=fp32, iterations=" + to_string(demo_data.num_iters) + ")",
+                      stat,
+                      data_size,
+                      all2all_factor,
+                      hccl_rank,
+                      demo_data.num_iters,
+                      test_type,
+                      "float");
+    }
+    else if (test_type == "send_recv")
+    {
+        double send_recv_factor = 1;
+        int    peerRank         = (get_hccl_rank() % 2) != 0 ? get_hccl_rank() - 1 : get_hccl_rank() + 1;
 
-            CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.host_to_device_stream));
+        auto stat = benchmark(demo_data, data_size, send_recv_factor, [&]() {
+            CHECK_HCCL_STATUS(send_recv_test((void*) output_dev_ptr,
+                                             (const void*) input_dev_ptr,
+                                             (uint64_t) input_host_data.size(),
+                                             demo_data.hccl_comm,
+                                             demo_data.collective_stream,
+                                             peerRank));
+        });
 
-            // Run HCCL AllGather collective
-            auto stat = benchmark(demo_data, [&]() {
-                CHECK_HCCL_STATUS(hcclAllGather((const void*) input_dev_ptr,
-                                                (void*) output_dev_ptr,
-                                                input_host_data.size(),
-                                                hcclFloat32,
-                                                demo_data.hccl_comm,
-                                                demo_data.collective_stream));
-            });
+        // Correctness check
 
-            // Correctness check
+        auto        output_host_data     = vector<float>(input_host_data.size());
+        const void* output_host_data_ptr = reinterpret_cast<void*>(output_host_data.data());
 
-            auto        output_host_data     = vector<float>(input_host_data.size() * demo_data.nranks);
-            const void* output_host_data_ptr = reinterpret_cast<void*>(output_host_data.data());
+        CHECK_SYNAPSE_STATUS(synHostMap(demo_data.device_handle, data_size, output_host_data_ptr));
 
-            CHECK_SYNAPSE_STATUS(
-                synHostMap(demo_data.device_handle, data_size * demo_data.nranks, output_host_data_ptr));
-            CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.device_to_host_stream,
-                                                 output_dev_ptr,
-                                                 data_size * demo_data.nranks,
-                                                 (uint64_t) output_host_data_ptr,
-                                                 DRAM_TO_HOST));
-            CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.device_to_host_stream));
+        CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.device_to_host_stream,
+                                             output_dev_ptr,
+                                             data_size,
+                                             (uint64_t) output_host_data_ptr,
+                                             DRAM_TO_HOST));
+        CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.device_to_host_stream));
 
-            for (size_t i = 0; i < output_host_data.size(); ++i)
+        for (size_t i = 0; i < input_host_data.size(); ++i)
+        {
+            if (abs(output_host_data[i] - (float) (peerRank + 1)) != 0)
             {
-                if (output_host_data[i] != i)
-                {
-                    is_ok = false;
-                }
+                is_ok = false;
             }
-
-            log() << "AllGather hccl_rank=" << hccl_rank << " size=" << data_size << " <float>"
-                  << " Input Buffer [" << input_host_data[0] << " " << input_host_data[1] << " " << input_host_data[2]
-                  << " " << input_host_data[3] << " ...]"
-                  << " gathered to Output Buffer [" << output_host_data[0] << " " << output_host_data[1] << " "
-                  << output_host_data[2] << " " << output_host_data[3] << " ...]"
-                  << " which is " << (is_ok ? "fine." : "bad.") << endl;
-
-            CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, input_host_data_ptr));
-            CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, output_host_data_ptr));
-
-            // End of correctness check
-
-            describe_stat("hcclAllGather(src!=dst, count=" + to_string(input_host_data.size()) +
-                              ", dtype=fp32, iterations=" + to_string(demo_data.num_iters) + ")",
-                          stat,
-                          data_size,
-                          all_gather_factor,
-                          hccl_rank,
-                          demo_data.num_iters,
-                          test_type,
-                          "float");
         }
-        else if (test_type == "all2all")
+
+        log() << "SendRecv hccl_rank=" << hccl_rank << " peerRank=" << peerRank << " size=" << data_size
+              << " <float>"
+              << " Input Buffer [" << input_host_data[0] << " " << input_host_data[1] << " " << input_host_data[2]
+              << " " << input_host_data[3] << " ...]"
+              << " Output Buffer [" << output_host_data[0] << " " << output_host_data[1] << " "
+              << output_host_data[2] << " " << output_host_data[3] << " ...]"
+              << " which is " << (is_ok ? "fine." : "bad.") << endl;
+
+        CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, input_host_data_ptr));
+        CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, output_host_data_ptr));
+
+        // End of correctness check
+        describe_stat("hcclSendRecv(src!=dst, count=" + to_string(input_host_data.size()) +
+                          ", dtype=fp32, iterations=" + to_string(demo_data.num_iters) + ")",
+                      stat,
+                      data_size,
+                      send_recv_factor,
+                      hccl_rank,
+                      demo_data.num_iters,
+                      test_type,
+                      "float");
+    }
+    else if (test_type == "reduce")
+    {
+        double reduce_factor = 1;
+        int    root          = get_demo_test_root();
+        // Fill input data, example:
+        // root = G1
+        // Input        |   Output
+        // G0 G1 G2 G3      G0 G1 G2 G3
+        // 0  1  2  3   =>      6
+        // 4  5  6  7          22
+        // 8  9  10 11         38
+        // 12 13 14 15         54
+
+        for (uint64_t i = 0; i < count; ++i)
         {
-            double all2all_factor = ((double) (demo_data.nranks - 1)) / ((double) demo_data.nranks);
-
-            // Fill input data, example:
-            // Input        |   Output
-            // G0 G1 G2 G3      G0 G1 G2 G3
-            // 0  2  4  6   =>  0  4  8  12
-            // 1  3  5  7       1  5  9  13
-            // 4  5  8  10      2  6  10 14
-            // 5  6  9  11      3  7  11 15
-            // 8  10 12 14      4  8  12 16
-            // 9  11 13 15      5  9  13 17
-            // 12 14 16 18      6  10 14 18
-            // 13 15 17 19      7  11 15 19
-            uint64_t chunkSize = count / demo_data.nranks;
-            for (uint64_t i = 0; i < count / chunkSize; ++i)
-            {
-                // We want to make sure we use different values on each cell and between ranks,
-                // but we don't want the summation to get too big, that is why we modulo by DATA_ELEMENTS_MAX.
-                for (uint64_t j = 0; j < chunkSize; ++j)
-                {
-                    int val                            = hccl_rank * chunkSize + j + demo_data.nranks * i;
-                    input_host_data[i * chunkSize + j] = (val % DATA_ELEMENTS_MAX);
-                }
-            }
+            input_host_data[i] = hccl_rank + (demo_data.nranks * (i % DATA_ELEMENTS_MAX));
+        }
 
-            // Copy from input_host_data_ptr to input_dev_ptr (to be used in benchmark)
-            CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.host_to_device_stream,
-                                                 (uint64_t) input_host_data_ptr,
-                                                 data_size,
-                                                 input_dev_ptr,
-                                                 HOST_TO_DRAM));
-            CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.host_to_device_stream));
-
-            // Run HCCL AlltoAll collective
-            auto stat = benchmark(demo_data, [&]() {
-                CHECK_HCCL_STATUS(hcclAlltoAll((const void*) input_dev_ptr,
-                                               (void*) output_dev_ptr,
-                                               input_host_data.size(),
-                                               hcclFloat32,
-                                               demo_data.hccl_comm,
-                                               demo_data.collective_stream));
-            });
-
-            // Correctness check
-            auto        output_host_data     = vector<float>(input_host_data.size());
-            const void* output_host_data_ptr = reinterpret_cast<void*>(output_host_data.data());
+        // Copy from input_host_data_ptr to input_dev_ptr (to be used in benchmark)
+        CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.host_to_device_stream,
+                                             (uint64_t) input_host_data_ptr,
+                                             data_size,
+                                             input_dev_ptr,
+                                             HOST_TO_DRAM));
 
+        CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.host_to_device_stream));
+
+        // Run HCCL Reduce collective
+        auto stat = benchmark(demo_data, data_size, reduce_factor, [&]() {
+            CHECK_HCCL_STATUS(hcclReduce((const void*) input_dev_ptr,
+                                         (void*) output_dev_ptr,
+                                         input_host_data.size(),
+                                         hcclFloat32,
+                                         hcclSum,
+                                         root,
+                                         demo_data.hccl_comm,
+                                         demo_data.collective_stream));
+        });
+
+        // Correctness check
+
+        auto        output_host_data     = std::vector<float>(input_host_data.size());
+        const void* output_host_data_ptr = reinterpret_cast<void*>(output_host_data.data());
+
+        log() << "Reduce hccl_rank=" << hccl_rank << " root=" << root << " size=" << data_size << " <float>"
+              << " Input Buffer [" << input_host_data[0] << " " << input_host_data[1] << " " << input_host_data[2]
+              << " " << input_host_data[3] << " ...]";
+
+        // The correctness check is relevant for the root's output buffer only
+        if (hccl_rank == root)
+        {
             CHECK_SYNAPSE_STATUS(synHostMap(demo_data.device_handle, data_size, output_host_data_ptr));
             CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.device_to_host_stream,
                                                  output_dev_ptr,
@@ -857,211 +1277,137 @@ int main()
                                                  DRAM_TO_HOST));
             CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.device_to_host_stream));
 
-            int start = hccl_rank * (count / chunkSize);
+            int start = 0;
+            int end   = demo_data.nranks - 1;
             int expected;
+            int addCommSize;
 
-            for (size_t i = 0; i < output_host_data.size(); ++i)
+            for (size_t i = 0; i < input_host_data.size(); ++i)
             {
-                expected = ((start + i) % DATA_ELEMENTS_MAX);
-                if ((float) output_host_data[i] != (float) expected)
+                addCommSize = demo_data.nranks * (i % DATA_ELEMENTS_MAX);
+                // Arithmetic progression
+                expected = ((start + addCommSize) + (end + addCommSize)) * demo_data.nranks / 2;
+                if (std::abs(output_host_data[i] - expected) != 0)
                 {
                     is_ok = false;
                 }
             }
 
-            log() << "All2All hccl_rank=" << hccl_rank << " size=" << data_size << " <float>"
-                  << " Input Buffer [" << input_host_data[0] << " " << input_host_data[1] << " " << input_host_data[2]
-                  << " " << input_host_data[3] << " ...]"
-                  << " distributed to Output Buffer [" << output_host_data[0] << " " << output_host_data[1] << " "
+            log() << " Output Buffer [" << output_host_data[0] << " " << output_host_data[1] << " "
                   << output_host_data[2] << " " << output_host_data[3] << " ...]"
-                  << " which is " << (is_ok ? "fine." : "bad.") << endl;
-
-            CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, input_host_data_ptr));
-            CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, output_host_data_ptr));
-
-            // End of correctness check
-
-            describe_stat("hcclAlltoAll(src!=dst, count=" + to_string(input_host_data.size()) +
-                              ", dtype=fp32, iterations=" + to_string(demo_data.num_iters) + ")",
-                          stat,
-                          data_size,
-                          all2all_factor,
-                          hccl_rank,
-                          demo_data.num_iters,
-                          test_type,
-                          "float");
+                  << " which is " << (is_ok ? "fine." : "bad.") << std::endl;
         }
-        else if (test_type == "send_recv")
+        else
         {
-            double send_recv_factor = 1;
-            int    peerRank         = (get_hccl_rank() % 2) != 0 ? get_hccl_rank() - 1 : get_hccl_rank() + 1;
+            log() << std::endl;
+        }
 
-            auto stat = benchmark(demo_data, [&]() {
-                CHECK_HCCL_STATUS(send_recv_test((void*) output_dev_ptr,
-                                                 (const void*) input_dev_ptr,
-                                                 (uint64_t) input_host_data.size(),
-                                                 demo_data.hccl_comm,
-                                                 demo_data.collective_stream,
-                                                 peerRank));
-            });
+        CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, input_host_data_ptr));
+        CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, output_host_data_ptr));
 
-            // Correctness check
+        // End of correctness check
 
-            auto        output_host_data     = vector<float>(input_host_data.size());
-            const void* output_host_data_ptr = reinterpret_cast<void*>(output_host_data.data());
+        describe_stat("Reduce(count=" + std::to_string(input_host_data.size()) +
+                          ", dtype=fp32, iterations=" + std::to_string(demo_data.num_iters) + ")",
+                      stat,
+                      data_size,
+                      reduce_factor,
+                      hccl_rank,
+                      demo_data.num_iters,
+                      test_type,
+                      "float");
+    }
+    else
+    {
+        throw runtime_error {"Unknown test type (" + test_type + ")"};
+    }
 
-            CHECK_SYNAPSE_STATUS(synHostMap(demo_data.device_handle, data_size, output_host_data_ptr));
+    CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.collective_stream));
 
-            CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.device_to_host_stream,
-                                                 output_dev_ptr,
-                                                 data_size,
-                                                 (uint64_t) output_host_data_ptr,
-                                                 DRAM_TO_HOST));
-            CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.device_to_host_stream));
+    CHECK_SYNAPSE_STATUS(synDeviceFree(demo_data.device_handle, input_dev_ptr, 0));
+    CHECK_SYNAPSE_STATUS(synDeviceFree(demo_data.device_handle, output_dev_ptr, 0));
 
-            for (size_t i = 0; i < input_host_data.size(); ++i)
-            {
-                if (abs(output_host_data[i] - (float) (peerRank + 1)) != 0)
-                {
-                    is_ok = false;
-                }
-            }
+    return is_ok;
+}
 
-            log() << "SendRecv hccl_rank=" << hccl_rank << " peerRank=" << peerRank << " size=" << data_size
-                  << " <float>"
-                  << " Input Buffer [" << input_host_data[0] << " " << input_host_data[1] << " " << input_host_data[2]
-                  << " " << input_host_data[3] << " ...]"
-                  << " Output Buffer [" << output_host_data[0] << " " << output_host_data[1] << " "
-                  << output_host_data[2] << " " << output_host_data[3] << " ...]"
-                  << " which is " << (is_ok ? "fine." : "bad.") << endl;
-
-            CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, input_host_data_ptr));
-            CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, output_host_data_ptr));
-
-            // End of correctness check
-            describe_stat("hcclSendRecv(src!=dst, count=" + to_string(input_host_data.size()) +
-                              ", dtype=fp32, iterations=" + to_string(demo_data.num_iters) + ")",
-                          stat,
-                          data_size,
-                          send_recv_factor,
-                          hccl_rank,
-                          demo_data.num_iters,
-                          test_type,
-                          "float");
-        }
-        else if (test_type == "reduce")
+int main()
+{
+    bool is_ok = true;
+    try
+    {
+        log() << "Running HCCL Demo :: A simple program demonstrating HCCL usage from C++" << endl;
+
+        if (verify_mpi_configuration())
         {
-            double reduce_factor = 1;
-            int    root          = get_demo_test_root();
-            // Fill input data, example:
-            // root = G1
-            // Input        |   Output
-            // G0 G1 G2 G3      G0 G1 G2 G3
-            // 0  1  2  3   =>      6
-            // 4  5  6  7          22
-            // 8  9  10 11         38
-            // 12 13 14 15         54
-
-            for (uint64_t i = 0; i < count; ++i)
-            {
-                input_host_data[i] = hccl_rank + (demo_data.nranks * (i % DATA_ELEMENTS_MAX));
-            }
+            throw runtime_error {
+                "HCCL demo compilation and user instruction regarding run type (MPI/pure) are non compatible. \nPlease "
+                "consider to build the demo with the correct instructions or run with -clean"};
+        }
 
-            // Copy from input_host_data_ptr to input_dev_ptr (to be used in benchmark)
-            CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.host_to_device_stream,
-                                                 (uint64_t) input_host_data_ptr,
-                                                 data_size,
-                                                 input_dev_ptr,
-                                                 HOST_TO_DRAM));
-
-            CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.host_to_device_stream));
-
-            // Run HCCL Reduce collective
-            auto stat = benchmark(demo_data, [&]() {
-                CHECK_HCCL_STATUS(hcclReduce((const void*) input_dev_ptr,
-                                             (void*) output_dev_ptr,
-                                             input_host_data.size(),
-                                             hcclFloat32,
-                                             hcclSum,
-                                             root,
-                                             demo_data.hccl_comm,
-                                             demo_data.collective_stream));
-            });
+#if MPI_ENABLED
+        log() << "MPI enabled. Make sure that HCCL demo is launched with mpirun." << std::endl;
+        // Initialize the Open MPI execution context.
+        CHECK_MPI_STATUS(MPI_Init(NULL, NULL));
+#endif  //MPI_ENABLED
 
-            // Correctness check
+        hccl_demo_data demo_data;
+        demo_data.nranks    = get_nranks();
+        demo_data.num_iters = get_demo_test_loop();
+        int hccl_rank       = get_hccl_rank();
 
-            auto        output_host_data     = std::vector<float>(input_host_data.size());
-            const void* output_host_data_ptr = reinterpret_cast<void*>(output_host_data.data());
+        // Initialize Synapse API context
+        CHECK_SYNAPSE_STATUS(synInitialize());
 
-            log() << "Reduce hccl_rank=" << hccl_rank << " root=" << root << " size=" << data_size << " <float>"
-                  << " Input Buffer [" << input_host_data[0] << " " << input_host_data[1] << " " << input_host_data[2]
-                  << " " << input_host_data[3] << " ...]";
+        // Acquire device
+        const synModuleId device_module_id = hccl_rank % get_demo_box_size();
+        CHECK_SYNAPSE_STATUS(synDeviceAcquireByModuleId(&demo_data.device_handle, device_module_id));
 
-            // The correctness check is relevant for the root's output buffer only
-            if (hccl_rank == root)
-            {
-                CHECK_SYNAPSE_STATUS(synHostMap(demo_data.device_handle, data_size, output_host_data_ptr));
-                CHECK_SYNAPSE_STATUS(synMemCopyAsync(demo_data.device_to_host_stream,
-                                                     output_dev_ptr,
-                                                     data_size,
-                                                     (uint64_t) output_host_data_ptr,
-                                                     DRAM_TO_HOST));
-                CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.device_to_host_stream));
-
-                int start = 0;
-                int end   = demo_data.nranks - 1;
-                int expected;
-                int addCommSize;
-
-                for (size_t i = 0; i < input_host_data.size(); ++i)
-                {
-                    addCommSize = demo_data.nranks * (i % DATA_ELEMENTS_MAX);
-                    // Arithmetic progression
-                    expected = ((start + addCommSize) + (end + addCommSize)) * demo_data.nranks / 2;
-                    if (std::abs(output_host_data[i] - expected) != 0)
-                    {
-                        is_ok = false;
-                    }
-                }
+#if AFFINITY_ENABLED
+        if (setupAffinity(device_module_id) != 0)
+        {
+            throw runtime_error {"Affinity setting for HCCL demo failed."};
+        }
+#endif
+        // Create Streams
+        CHECK_SYNAPSE_STATUS(
+            synStreamCreate(&demo_data.collective_stream, demo_data.device_handle, STREAM_TYPE_NETWORK_COLLECTIVE, 0));
+        CHECK_SYNAPSE_STATUS(synStreamCreate(&demo_data.device_to_host_stream,
+                                             demo_data.device_handle,
+                                             STREAM_TYPE_COPY_DEVICE_TO_HOST,
+                                             0));
+        CHECK_SYNAPSE_STATUS(synStreamCreate(&demo_data.host_to_device_stream,
+                                             demo_data.device_handle,
+                                             STREAM_TYPE_COPY_HOST_TO_DEVICE,
+                                             0));
 
-                log() << " Output Buffer [" << output_host_data[0] << " " << output_host_data[1] << " "
-                      << output_host_data[2] << " " << output_host_data[3] << " ...]"
-                      << " which is " << (is_ok ? "fine." : "bad.") << std::endl;
-            }
-            else
-            {
-                log() << std::endl;
-            }
+        // Generate unique id
+        hcclUniqueId  unique_id {};
+        constexpr int master_mpi_rank = 0;
 
-            CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, input_host_data_ptr));
-            CHECK_SYNAPSE_STATUS(synHostUnmap(demo_data.device_handle, output_host_data_ptr));
+        if (hccl_rank == master_mpi_rank)
+        {
+            CHECK_HCCL_STATUS(hcclGetUniqueId(&unique_id));
+        }
 
-            // End of correctness check
+#if MPI_ENABLED
+        CHECK_MPI_STATUS(MPI_Bcast(&unique_id, sizeof(unique_id), MPI_BYTE, master_mpi_rank, MPI_COMM_WORLD));
+#endif  // MPI_ENABLED
 
-            describe_stat("Reduce(count=" + std::to_string(input_host_data.size()) +
-                              ", dtype=fp32, iterations=" + std::to_string(demo_data.num_iters) + ")",
-                          stat,
-                          data_size,
-                          reduce_factor,
-                          hccl_rank,
-                          demo_data.num_iters,
-                          test_type,
-                          "float");
-        }
-        else
+        // Create new HCCL communicator
+        CHECK_HCCL_STATUS(hcclCommInitRank(&demo_data.hccl_comm, demo_data.nranks, unique_id, hccl_rank));
+
+        // The node ID may be derived collectively, therefore all the ranks resolve it before testing
+        get_demo_node_id();
+
+        // All the requested sizes are tested using the same communicator
+        for (uint64_t data_size : get_demo_test_sizes())
         {
-            log() << "Unknown test type (" << test_type << ")" << endl;
-            return -1;
+            is_ok = run_test(demo_data, hccl_rank, data_size) && is_ok;
         }
 
-        CHECK_SYNAPSE_STATUS(synStreamSynchronize(demo_data.collective_stream));
-
         // Destroy HCCL communicator
         CHECK_HCCL_STATUS(hcclCommDestroy(demo_data.hccl_comm));
 
-        CHECK_SYNAPSE_STATUS(synDeviceFree(demo_data.device_handle, input_dev_ptr, 0));
-        CHECK_SYNAPSE_STATUS(synDeviceFree(demo_data.device_handle, output_dev_ptr, 0));
-
         // Clean up HCCL
         CHECK_SYNAPSE_STATUS(synDeviceRelease(demo_data.device_handle));
 
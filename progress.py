@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+
+import os, socket, json, time, threading
+
+class Progress:
+    def __init__(self, socket_path, interval, stall_timeout, dump_path=None, dump_format='jsonl', expected_ranks=None):
+        self.socket_path    = socket_path
+        self.interval       = interval
+        self.stall_timeout  = stall_timeout
+        self.dump_path      = dump_path
+        self.dump_format    = dump_format
+        self.expected_ranks = expected_ranks or []
+        self.recv_size      = 4096
+        self.ranks          = {}
+        self.stalled        = set()
+        self.lock           = threading.Lock()
+        self.stop_event     = threading.Event()
+        self.thread         = None
+        self.sock           = None
+        self.start_time     = None
+
+    def start(self):
+        '''Bind the progress socket and start collecting records from the ranks.'''
+        try:
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            self.sock.bind(self.socket_path)
+            self.sock.settimeout(min(self.interval, 0.5))
+            self.start_time = time.time()
+            self.thread = threading.Thread(target=self.collect, daemon=True)
+            self.thread.start()
+            self.print_progress(f'Listening for rank progress on {self.socket_path}')
+        except Exception as e:
+            self.print_progress(f'[start] failed with exception: {e}')
+
+    def stop(self):
+        '''Stop collecting, print the final view and remove the progress socket.'''
+        try:
+            if not self.thread:
+                return
+            self.stop_event.set()
+            self.thread.join()
+            self.thread = None
+            self.display()
+            if self.dump_path and self.dump_format == 'prom':
+                self.dump_prometheus()
+            self.sock.close()
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+        except Exception as e:
+            self.print_progress(f'[stop] failed with exception: {e}')
+
+    def collect(self):
+        '''Receive progress records until stopped, refreshing the view every interval.'''
+        try:
+            last_display = time.time()
+            while not self.stop_event.is_set():
+                try:
+                    data = self.sock.recv(self.recv_size)
+                    self.update(data)
+                except socket.timeout:
+                    pass
+                now = time.time()
+                if now - last_display >= self.interval:
+                    last_display = now
+                    self.check_stalls(now)
+                    self.display()
+                    if self.dump_path and self.dump_format == 'prom':
+                        self.dump_prometheus()
+        except Exception as e:
+            self.print_progress(f'[collect] failed with exception: {e}')
+
+    def update(self, data):
+        '''Store a single progress record received from one of the ranks.'''
+        try:
+            record = json.loads(data.decode('utf-8'))
+            record['received'] = time.time()
+            with self.lock:
+                self.ranks[record['rank']] = record
+            if self.dump_path and self.dump_format == 'jsonl':
+                with open(self.dump_path, 'a') as dump_file:
+                    dump_file.write(json.dumps(record) + '\n')
+        except (ValueError, KeyError) as e:
+            self.print_progress(f'Ignoring malformed progress record: {data}, {e}')
+
+    def check_stalls(self, now):
+        '''Watchdog: flag ranks which have not completed any iteration for stall_timeout seconds.
+           Expected ranks which have not reported at all within stall_timeout of the start are flagged
+           as well, since a rank may hang before its first record (device acquire, communicator init).'''
+        try:
+            with self.lock:
+                for rank in self.expected_ranks:
+                    if rank not in self.ranks and rank not in self.stalled and now - self.start_time >= self.stall_timeout:
+                        self.stalled.add(rank)
+                        self.print_progress(f'[WATCHDOG] rank {rank} has not reported any progress '
+                                            f'{now - self.start_time:.1f}s after the start')
+                for rank, record in self.ranks.items():
+                    idle_time = now - record['received']
+                    if record['phase'] != 'done' and idle_time >= self.stall_timeout:
+                        if rank not in self.stalled:
+                            self.stalled.add(rank)
+                            self.print_progress(f'[WATCHDOG] rank {rank} (module {record["module_id"]}, {record["host"]}) '
+                                                f'made no progress for {idle_time:.1f}s, '
+                                                f'last seen in {record["phase"]} at iteration {record["iter"]}/{record["num_iters"]}')
+                    elif rank in self.stalled:
+                        self.stalled.discard(rank)
+                        self.print_progress(f'[WATCHDOG] rank {rank} resumed progress')
+        except Exception as e:
+            self.print_progress(f'[check_stalls] failed with exception: {e}')
+
+    def display(self):
+        '''Print one line per rank with its latest progress.'''
+        try:
+            now = time.time()
+            with self.lock:
+                records = [self.ranks[rank] for rank in sorted(self.ranks)]
+                silent  = [rank for rank in sorted(self.stalled) if rank not in self.ranks]
+            if not records and not silent:
+                return
+            lines = [f'[PROGRESS] elapsed {now - self.start_time:.1f}s']
+            for rank in silent:
+                lines.append(f'[PROGRESS] rank {str(rank).rjust(4)} no progress reported [STALLED]')
+            for record in records:
+                percent = 100.0 * record['iter'] / record['num_iters'] if record['num_iters'] else 0
+                line = (f'[PROGRESS] rank {str(record["rank"]).rjust(4)} '
+                        f'module {record["module_id"]} {record["host"]} size {record["size"]} '
+                        f'{record["phase"].ljust(6)} {record["iter"]}/{record["num_iters"]} ({percent:.1f}%) '
+                        f'{record["bandwidth"] / 1e6:.3f} MB/s '
+                        f'elapsed {record["elapsed"]:.1f}s '
+                        f'last update {now - record["received"]:.1f}s ago')
+                if record['rank'] in self.stalled:
+                    line += ' [STALLED]'
+                lines.append(line)
+            print('\n'.join(lines), flush=True)
+        except Exception as e:
+            self.print_progress(f'[display] failed with exception: {e}')
+
+    def dump_prometheus(self):
+        '''Write the latest progress of every rank in Prometheus textfile collector format.
+           The file is replaced atomically so the collector never reads a partial file.'''
+        try:
+            metrics = [('hccl_demo_progress_iterations',                 'Completed iterations',          lambda r: r['iter']),
+                       ('hccl_demo_progress_total_iterations',           'Requested iterations',          lambda r: r['num_iters']),
+                       ('hccl_demo_progress_bandwidth_bytes_per_second', 'Rolling bandwidth',             lambda r: r['bandwidth']),
+                       ('hccl_demo_progress_elapsed_seconds',            'Elapsed time of the test loop', lambda r: r['elapsed']),
+                       ('hccl_demo_progress_last_update_timestamp',      'Time of the last record',       lambda r: r['received']),
+                       ('hccl_demo_progress_stalled',                    'Rank flagged by the watchdog',  lambda r: int(r['rank'] in self.stalled))]
+            with self.lock:
+                records = [self.ranks[rank] for rank in sorted(self.ranks)]
+            lines = []
+            for name, description, value in metrics:
+                lines.append(f'# HELP {name} {description}')
+                lines.append(f'# TYPE {name} gauge')
+                for record in records:
+                    labels = f'rank="{record["rank"]}",module_id="{record["module_id"]}",host="{record["host"]}",test="{record["test"]}",size="{record["size"]}"'
+                    lines.append(f'{name}{{{labels}}} {value(record)}')
+            tmp_path = self.dump_path + '.tmp'
+            with open(tmp_path, 'w') as dump_file:
+                dump_file.write('\n'.join(lines) + '\n')
+            os.replace(tmp_path, self.dump_path)
+        except Exception as e:
+            self.print_progress(f'[dump_prometheus] failed with exception: {e}')
+
+    def print_progress(self, msg):
+        try:
+            print(f'Progress: {msg}', flush=True)
+        except Exception as e:
+            self.print_progress(f'[print_progress] failed with exception: {e}')
@@ -10,10 +10,23 @@ Args
     --ranks_per_node   - int, Number of ranks participating in the demo for current node
     --node_id          - int, ID of the running host. Each host should have unique id between 0-num_nodes
     --test             - str, Which hccl test to run (for example: broadcast/all_reduce) (default: broadcast)
-    --size             - str, Data size in units of G,M,K,B or no unit (default: 33554432)
+    --size             - str, Data size in units of G,M,K,B or no unit, or a comma separated list of sizes (default: 33554432)
     --loop             - int, Number of iterations (default: 10)
     --test_root        - int, Index of root rank for broadcast and reduce tests
     --csv_path         - str, Path to a file for results output
+    --slowest_ranks    - int, Number of slowest ranks to report in the benchmark results (default: 3)
+    --progress_interval - float, Seconds between live progress reports of each rank, 0 to disable (default: 0)
+    --progress_dump    - str, Path to a file for progress records output
+    --progress_format  - str, Format of the progress dump: jsonl or prom (Prometheus textfile) (default: jsonl)
+    --stall_timeout    - float, Seconds without progress before a rank is flagged as stalled (default: 60)
+    --scenario         - str, Path to a JSON/YAML scenario file listing test cases to run
+    --report           - str, Path to the consolidated JSONL report of a scenario (default: <scenario>_report.jsonl)
+    -resume            - Resume a scenario from the last completed case of its report
+    -autotune          - Search the host scaleout env variables for the best configuration of the test and sizes
+    --autotune_space   - str, Path to a JSON/YAML file with the candidate values of every env variable
+    --autotune_rounds  - int, Number of autotune rounds, the loop is doubled every round (default: 3)
+    --autotune_margin  - float, Relative bandwidth margin under which configurations are dropped (default: 0.1)
+    --autotune_env     - str, Path to the env file with the best configuration (default: hccl_demo_autotune.env)
     -mpi               - Use MPI for managing execution
     -clean             - Clear old executable and compile a new one
     -list              - Display a list of available tests
@@ -71,6 +84,26 @@ class DemoTest:
         self.ERROR                    = 1
         self.SUCCESS                  = 0
         self.csv_path                 = ""
+        self.slowest_ranks            = None
+        self.progress_interval        = None
+        self.progress_dump            = None
+        self.progress_format          = None
+        self.stall_timeout            = None
+        self.progress_socket          = f'/tmp/hccl_demo_progress_{os.getpid()}.sock'
+        self.scenario                 = None
+        self.report                   = None
+        self.resume                   = None
+        self.scenario_obj             = None
+        self.launches                 = []
+        self.env_overrides            = {}
+        self.summary_path             = f'/tmp/hccl_demo_summary_{os.getpid()}.jsonl'
+        self.autotune                 = None
+        self.autotune_space           = None
+        self.autotune_rounds          = None
+        self.autotune_margin          = None
+        self.autotune_env             = None
+        self.autotune_obj             = None
+        self.exit_on_failure          = True
         self.log_prefix               = "HCCL_demo_log_"
         self.demo_exe                 = "./hccl_demo"
         self.test_list                = ['broadcast',
@@ -111,13 +144,39 @@ class DemoTest:
         parser.add_argument("--test", type=str,
                             help="Specify test (use '-l' option for test list)", default="broadcast")
         parser.add_argument("--size", metavar="N", type=str,
-                            help="Data size in units of G,M,K,B or no unit. Default is Bytes.", default=33554432)
+                            help="Data size in units of G,M,K,B or no unit, or a comma separated list of sizes. Default is Bytes.", default=33554432)
         parser.add_argument("--loop", type=int,
                             help="Number of loop iterations", default=10)
         parser.add_argument("--test_root", type=int, default=0,
                             help="Index of root rank for broadcast and reduce tests (optional)")
         parser.add_argument("--csv_path", type=str,
                             help="Path to a file for results output (optional)")
+        parser.add_argument("--slowest_ranks", type=int, default=3,
+                            help="Number of slowest ranks to report in the benchmark results")
+        parser.add_argument("--progress_interval", type=float, default=0,
+                            help="Seconds between live progress reports of each rank, 0 to disable (optional)")
+        parser.add_argument("--progress_dump", type=str,
+                            help="Path to a file for progress records output (optional)")
+        parser.add_argument("--progress_format", type=str, choices=['jsonl', 'prom'], default='jsonl',
+                            help="Format of the progress dump: jsonl or prom (Prometheus textfile)")
+        parser.add_argument("--stall_timeout", type=float, default=60,
+                            help="Seconds without progress before a rank is flagged as stalled")
+        parser.add_argument("--scenario", type=str,
+                            help="Path to a JSON/YAML scenario file listing test cases to run (optional)")
+        parser.add_argument("--report", type=str,
+                            help="Path to the consolidated JSONL report of a scenario (optional)")
+        parser.add_argument("-resume", action="store_true",
+                            help="Resume a scenario from the last completed case of its report")
+        parser.add_argument("-autotune", action="store_true",
+                            help="Search the host scaleout env variables for the best configuration of the test and sizes")
+        parser.add_argument("--autotune_space", type=str,
+                            help="Path to a JSON/YAML file with the candidate values of every env variable (optional)")
+        parser.add_argument("--autotune_rounds", type=int, default=3,
+                            help="Number of autotune rounds, the loop is doubled every round")
+        parser.add_argument("--autotune_margin", type=float, default=0.1,
+                            help="Relative bandwidth margin under which configurations are dropped")
+        parser.add_argument("--autotune_env", type=str, default='hccl_demo_autotune.env',
+                            help="Path to the env file with the best configuration")
         parser.add_argument("-mpi", action="store_true",
                             help="Use MPI for managing execution")
         parser.add_argument("-clean", action="store_true",
@@ -163,6 +222,8 @@ class DemoTest:
                     self.exit_demo(f'[validate_arguments] HCCL demo is running in pure more, therefore the following arguments cannot be used: {self.mpi_args}')
                 self.number_of_processes = min(self.ranks_per_node, self.nranks)
                 self.log_debug(f'Number of processes to be used is: {self.number_of_processes}')
+                if self.autotune and self.is_multi_node():
+                    self.exit_demo(f'[validate_arguments] Autotune over multiple nodes requires -mpi, since results are available to the host of rank 0 only')
             else:
                 invalid_arguments = []
                 if self.node_id >= 0:
@@ -173,6 +234,16 @@ class DemoTest:
                     invalid_arguments.append("ranks_per_node")
                 if invalid_arguments:
                     self.exit_demo(f'[validate_arguments] the following command line arguments cannot be used in MPI mode: {invalid_arguments}')
+            if self.slowest_ranks < 0:
+                self.exit_demo(f'[validate_arguments] Argument slowest_ranks was set to: {self.slowest_ranks}')
+            if self.autotune and self.autotune_rounds < 1:
+                self.exit_demo(f'[validate_arguments] Argument autotune_rounds was set to: {self.autotune_rounds}')
+            if self.autotune and not 0 <= self.autotune_margin < 1:
+                self.exit_demo(f'[validate_arguments] Argument autotune_margin was set to: {self.autotune_margin}')
+            if self.progress_interval < 0:
+                self.exit_demo(f'[validate_arguments] Argument progress_interval was set to: {self.progress_interval}')
+            if self.progress_interval and self.stall_timeout <= self.progress_interval:
+                self.exit_demo(f'[validate_arguments] Argument stall_timeout ({self.stall_timeout}) must be greater than progress_interval ({self.progress_interval})')
             if not self.test in self.test_list:
                 self.display_test_list()
                 self.exit_demo(f'[validate_arguments] Chosen test: {self.test} is not part of the tests list')
@@ -190,7 +261,16 @@ class DemoTest:
             if self.list_tests:
                 self.display_test_list()
                 self.exit_demo()
+            if self.autotune and self.scenario:
+                self.exit_demo(f'[prepare_demo] Arguments autotune and scenario cannot be used together')
+            if self.scenario and not self.mpi and self.is_multi_node():
+                self.exit_demo(f'[prepare_demo] Scenario over multiple nodes requires -mpi, since results are available to the host of rank 0 only')
+            if self.scenario:
+                self.prepare_scenario()
+            if self.autotune:
+                self.prepare_autotune()
             self.validate_arguments()
+            self.clear_progress_dump()
             self.get_env()
             self.parse_size()
             self.prepare_command()
@@ -247,6 +327,12 @@ class DemoTest:
             cmd_args.append("HCCL_DEMO_MPI_REQUESTED=" + str(int(self.mpi)))
             cmd_args.append("MPI_ENABLED="             + str(int(self.mpi)))
             cmd_args.append("NUMA_MAPPING_DIR="        + str(numa_output_path))
+            cmd_args.append("HCCL_DEMO_SLOWEST_RANKS=" + str(self.slowest_ranks))
+            if self.scenario or self.autotune:
+                cmd_args.append("HCCL_DEMO_SUMMARY_PATH=" + str(self.summary_path))
+            if self.progress_interval:
+                cmd_args.append("HCCL_DEMO_PROGRESS_SOCKET="   + str(self.progress_socket))
+                cmd_args.append("HCCL_DEMO_PROGRESS_INTERVAL=" + str(self.progress_interval))
             cmd_args.extend(self.set_optional_env())
             if not self.mpi:
                 rank = id + self.node_id * self.number_of_processes
@@ -254,6 +340,7 @@ class DemoTest:
                 cmd_args.append("HCCL_RANK=" + str(rank))
                 cmd_args.append("HCCL_NRANKS=" + str(self.nranks))
                 cmd_args.append("HCCL_BOX_SIZE=" + str(self.ranks_per_node))
+                cmd_args.append("HCCL_DEMO_NODE_ID=" + str(self.node_id))
                 cmd_args.append(self.demo_exe)
             cmd = " ".join(cmd_args)
             return cmd
@@ -274,12 +361,17 @@ class DemoTest:
 
     def set_optional_env(self):
         '''The following method is used in order to append optional environment
-           variables to the command line, in case any were requsted by the user.'''
+           variables to the command line, in case any were requsted by the user.
+           Env overrides of the running scenario case or autotune configuration take precedence
+           over the environment, an override set to None removes the variable from the command line.'''
         try:
             optional_args = []
             for env in self.optional_env_list:
-                if env in os.environ:
+                if env in os.environ and env not in self.env_overrides:
                     optional_args.append(f'{env}={os.getenv(env).strip()}')
+            for env, value in self.env_overrides.items():
+                if value is not None:
+                    optional_args.append(f'{env}={value.strip()}')
             return optional_args
         except Exception as e:
             self.log_error(f'[set_optional_env] {e}' ,exception=True)
@@ -297,35 +389,230 @@ class DemoTest:
         '''The following method is used in order to trigger HCCL demo run.
            HCCL demo can be triggered in one of the following modes:
            1) Pure mode (default)
-           2) MPI mode (triggered by adding -mpi)'''
+           2) MPI mode (triggered by adding -mpi)
+           In both modes, live progress of the ranks is displayed when --progress_interval is set.
+           Returns False when the run failed and exit_on_failure is disabled.'''
+        progress = None
         try:
+            if self.progress_interval:
+                progress = self.start_progress()
             if self.mpi:
-                self.run_mpi_test()
+                return self.run_mpi_test()
             else:
-                self.run_test()
+                return self.run_test()
         except Exception as e:
             self.log_error(f'[run_demo] {e}' ,exception=True)
             raise Exception(e)
+        finally:
+            if progress:
+                progress.stop()
+
+    def clear_progress_dump(self):
+        '''The following method is used in order to remove the JSONL progress dump of a previous run.
+           It is called once per invocation, since scenario and autotune runs append the records
+           of all their launches to the same dump.'''
+        try:
+            if self.progress_interval and self.progress_dump and self.progress_format == 'jsonl' and os.path.exists(self.progress_dump):
+                self.log_debug(f'Removing old progress dump: {self.progress_dump}')
+                os.remove(self.progress_dump)
+        except Exception as e:
+            self.log_error(f'[clear_progress_dump] {e}', exception=True)
+            raise Exception(e)
+
+    def start_progress(self):
+        '''The following method is used in order to start collecting the progress
+           records which the ranks send to a local socket during the test loop.
+           Progress is displayed one line per rank, ranks which stop making progress
+           for --stall_timeout seconds are flagged by a watchdog and the records can be
+           dumped to --progress_dump as JSONL or as a Prometheus textfile.
+           Please notice that only ranks running on the current host can report progress.
+           In pure mode the local ranks are known, so ranks which never report are flagged as well.'''
+        try:
+            from progress import Progress
+            self.log_debug('Starting progress monitor')
+            expected_ranks = []
+            if not self.mpi:
+                expected_ranks = [i + self.node_id * self.number_of_processes for i in range(self.number_of_processes)]
+            progress = Progress(self.progress_socket,
+                                self.progress_interval,
+                                self.stall_timeout,
+                                self.progress_dump,
+                                self.progress_format,
+                                expected_ranks)
+            progress.start()
+            return progress
+        except Exception as e:
+            self.log_error(f'[start_progress] {e}', exception=True)
+            raise Exception(e)
+
+    def prepare_scenario(self):
+        '''The following method is used in order to expand the scenario file into test cases.
+           Cases which differ only by their size are grouped into a single launch,
+           and cases already present in the report are skipped when -resume is used.
+           The first launch is applied so the build and affinity settings are prepared for it.'''
+        try:
+            from scenario import Scenario
+            if not self.report:
+                self.report = os.path.splitext(self.scenario)[0] + '_report.jsonl'
+            defaults = {'test': self.test, 'size': str(self.size).split(','), 'loop': self.loop, 'test_root': self.test_root}
+            self.scenario_obj = Scenario(self.scenario, self.report, self.resume, defaults, self.test_list, self.convert_size)
+            cases = self.scenario_obj.expand()
+            completed = self.scenario_obj.load_report()
+            self.launches = self.scenario_obj.get_launches()
+            self.log_info(f'Scenario {self.scenario}: {len(cases)} cases, {len(completed)} already completed, '
+                          f'{len(self.launches)} launches to run. Report: {self.report}', 'green')
+            if not self.launches:
+                self.display_report()
+                self.exit_demo()
+            self.apply_launch(self.launches[0])
+        except Exception as e:
+            self.log_error(f'[prepare_scenario] {e}', exception=True)
+            raise Exception(e)
+
+    def apply_launch(self, launch):
+        '''The following method is used in order to set the test attributes of a scenario launch.'''
+        try:
+            self.test          = launch['test']
+            self.size          = ','.join(str(size) for size in launch['sizes'])
+            self.loop          = launch['loop']
+            self.test_root     = launch['test_root']
+            self.env_overrides = launch['env']
+        except Exception as e:
+            self.log_error(f'[apply_launch] {e}', exception=True)
+            raise Exception(e)
+
+    def run_scenario(self):
+        '''The following method is used in order to run all the launches of a scenario.
+           The results of every launch are appended to the report as soon as it finishes,
+           so an interrupted scenario can be continued using -resume.'''
+        try:
+            for index, launch in enumerate(self.launches):
+                env = ' '.join(f'{key}={value}' for key, value in sorted(launch['env'].items()))
+                self.log_info(f'\nScenario launch {index + 1}/{len(self.launches)}: test={launch["test"]} '
+                              f'sizes={launch["sizes"]} loop={launch["loop"]} {env}', 'cyan')
+                self.apply_launch(launch)
+                self.cmd_list = []
+                self.prepare_command()
+                if os.path.exists(self.summary_path):
+                    os.remove(self.summary_path)
+                self.run_demo()
+                missing = self.scenario_obj.record(launch, self.summary_path)
+                for case in missing:
+                    self.log_warning(f'No result was found for case {case["name"]} size={case["size"]}, '
+                                     f'please make sure rank 0 runs on this host')
+            if os.path.exists(self.summary_path):
+                os.remove(self.summary_path)
+            self.display_report()
+        except Exception as e:
+            self.log_error(f'[run_scenario] {e}', exception=True)
+            raise Exception(e)
+
+    def display_report(self):
+        '''The following method is used in order to display the consolidated report of a scenario.'''
+        try:
+            self.log_info(f'\nScenario report ({self.report}):', 'green')
+            for line in self.scenario_obj.get_report_lines():
+                self.log_info(line)
+        except Exception as e:
+            self.log_error(f'[display_report] {e}', exception=True)
+            raise Exception(e)
+
+    def prepare_autotune(self):
+        '''The following method is used in order to expand the autotune search space into configurations.
+           The first configuration is applied so the build and affinity settings are prepared for it.'''
+        try:
+            from autotune import Autotune
+            sizes = [int(self.convert_size(size)) for size in str(self.size).split(',')]
+            self.autotune_obj = Autotune(self.autotune_space, sorted(set(sizes)), self.autotune_margin)
+            configs = self.autotune_obj.expand()
+            self.log_info(f'Autotune: {len(configs)} configurations, sizes {self.autotune_obj.sizes}, '
+                          f'up to {self.autotune_rounds} rounds', 'green')
+            # Every configuration sets or unsets all the variables of the space,
+            # so their values must not be inherited from the environment.
+            for env in configs[0]:
+                if env in os.environ:
+                    self.log_debug(f'Autotune ignores {env}={os.getenv(env)} from the environment')
+                    del os.environ[env]
+            self.env_overrides = configs[0]
+        except Exception as e:
+            self.log_error(f'[prepare_autotune] {e}', exception=True)
+            raise Exception(e)
+
+    def run_autotune(self):
+        '''The following method is used in order to search for the best host scaleout configuration.
+           Every round runs all the remaining configurations with all the sizes in a single launch each,
+           doubling the loop of the previous round. After every round, configurations which are worse
+           than the best one by more than --autotune_margin in every size band are dropped.
+           Configurations whose launch fails are recorded with no bandwidth and the search goes on,
+           the search is aborted only when no results were collected for any configuration of a round.
+           The best configuration is written as an env file to --autotune_env.'''
+        try:
+            self.exit_on_failure = False
+            base_loop = self.loop
+            self.size = ','.join(str(size) for size in self.autotune_obj.sizes)
+            for round_index in range(self.autotune_rounds):
+                self.loop = base_loop * 2 ** round_index
+                configs   = list(self.autotune_obj.configs)
+                for index, config in enumerate(configs):
+                    self.log_info(f'\nAutotune round {round_index + 1}/{self.autotune_rounds}, configuration '
+                                  f'{index + 1}/{len(configs)}: {self.autotune_obj.describe(config)} loop={self.loop}', 'cyan')
+                    self.env_overrides = config
+                    self.cmd_list = []
+                    self.prepare_command()
+                    if os.path.exists(self.summary_path):
+                        os.remove(self.summary_path)
+                    if not self.run_demo():
+                        self.autotune_obj.set_failed(config)
+                        self.log_warning(f'Autotune configuration {self.autotune_obj.describe(config)} failed, '
+                                         f'recording no bandwidth for all sizes')
+                        continue
+                    missing = self.autotune_obj.update(config, self.summary_path)
+                    if missing:
+                        self.log_warning(f'No result was found for sizes {missing}, please make sure rank 0 runs on this host')
+                if not self.autotune_obj.has_results():
+                    self.exit_demo(f'[run_autotune] No results were collected in round {round_index + 1}, '
+                                   f'all configurations failed or rank 0 does not run on this host')
+                dropped = self.autotune_obj.prune()
+                for line in self.autotune_obj.get_report_lines(self.test):
+                    self.log_info(line, 'green')
+                for config in dropped:
+                    self.log_info(f'Autotune dropped: {self.autotune_obj.describe(config)}', 'yellow')
+                if len(self.autotune_obj.configs) == 1:
+                    break
+            if os.path.exists(self.summary_path):
+                os.remove(self.summary_path)
+            best = self.autotune_obj.write_env_file(self.autotune_env, self.test)
+            self.log_info(f'\nAutotune best configuration: {self.autotune_obj.describe(best)}, written to {self.autotune_env}', 'green')
+        except Exception as e:
+            self.log_error(f'[run_autotune] {e}', exception=True)
+            raise Exception(e)
 
     def run_test(self):
         '''The following method is used in order to run HCCL demo test in pure mode.
-           HCCL demo will invoke as many processes as were requested by the user.'''
+           HCCL demo will invoke as many processes as were requested by the user.
+           Every process runs in its own session, and is terminated together with its pool worker.
+           In case one of the processes fails, HCCL demo exits unless exit_on_failure is disabled,
+           in which case the remaining processes are terminated and False is returned.'''
         try:
             self.log_info("HCCL demo test command line:", 'green')
             self.log_info('\n\n'.join(self.cmd_list))
-            pool = Pool(processes=self.nranks)
+            pool = Pool(processes=self.nranks, initializer=self.init_worker)
             results = pool.imap_unordered(self.run_process, self.cmd_list)
             for res in results:
                 if res != 0:
                     pool.close()
                     pool.terminate()
                     pool.join()
+                    if not self.exit_on_failure:
+                        self.log_error(f'[run_test] One of the hccl_demo processes failed, the remaining processes were terminated')
+                        return False
                     self.log_error(f'[run_test] One of the hccl_demo processes failed, terminating hccl demo')
                     os.killpg(0, signal.SIGTERM)
                     self.exit_demo()
                     break
             pool.close()
             pool.join()
+            return True
 
         except Exception as e:
             self.log_error(f'[run_test] One of the hccl_demo processes failed, terminating hccl demo, {e}, Processes: {str(self.cmd_list)}', exception=True)
@@ -344,11 +631,38 @@ class DemoTest:
             process.communicate()
             return_code = process.poll()
             if return_code != 0:
+                if not self.exit_on_failure:
+                    self.log_error(f'[run_mpi_test] One of the hccl_test processes failed with code: {return_code}')
+                    return False
                 self.exit_demo(f'[run_mpi_test] One of the hccl_test processes failed, terminating hccl demo')
+            return True
         except Exception as e:
             self.log_error(f'[run_mpi_test] {e}', exception=True)
             raise Exception(e)
 
+    def init_worker(self):
+        '''The following method is used in order to prepare a pool worker of pure mode,
+           a terminated worker terminates the hccl_demo process it runs.'''
+        try:
+            signal.signal(signal.SIGTERM, self.stop_worker)
+        except Exception as e:
+            self.log_error(f'[init_worker] {e}', exception=True)
+            raise Exception(e)
+
+    def stop_worker(self, signum, frame):
+        sys.exit(128 + signum)
+
+    def terminate_process(self, process):
+        '''The following method is used in order to terminate the session of a running process,
+           the processes of HCCL demo runner and of its shell pipeline are not affected.'''
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+        except Exception as e:
+            self.log_error(f'[terminate_process] {e}', exception=True)
+            raise Exception(e)
+
     def run_command(self, command):
         '''The following method is used in order to run commands as a subprocess.'''
         try:
@@ -361,10 +675,16 @@ class DemoTest:
             raise Exception(e)
 
     def run_process(self, process):
-        '''The following method is used in order to trigger system calls.'''
+        '''The following method is used in order to trigger system calls.
+           The process is started in its own session, so that it can be terminated on its own.'''
         try:
             self.log_debug(f'Running process: {process}')
-            return os.system(process)
+            process = subprocess.Popen(process, shell=True, start_new_session=True)
+            try:
+                return process.wait()
+            except BaseException:
+                self.terminate_process(process)
+                raise
         except Exception as e:
             self.log_error(f'[run_process] {e}' ,exception=True)
             raise Exception(e)
@@ -458,9 +778,18 @@ class DemoTest:
         '''The following method is used to parse the size to be sent.
            The format of the size would be <size><unit> , for example: 4G.
            One of the following sizes can be requested: G/M/K/B (not case sensitive).
-           The unit is optional, if omitted the default unit <B> will be used.'''
+           The unit is optional, if omitted the default unit <B> will be used.
+           A comma separated list of sizes can be requested, for example: 1M,32M,1G.'''
+        try:
+            self.size = ','.join(self.convert_size(size) for size in str(self.size).split(','))
+        except Exception as e:
+            self.log_error(f'[parse_size] {e}' ,exception=True)
+            raise Exception(e)
+
+    def convert_size(self, size):
+        '''The following method is used to convert a single size to Bytes.'''
         try:
-            size = str(self.size)
+            size = str(size).strip()
             units_dict = {"G": 1024*1024*1024,
                           "M": 1024*1024,
                           "K": 1024,
@@ -476,12 +805,12 @@ class DemoTest:
                 else:
                     self.log_error("Provided unit is not supported. Please choose between G,M,K,B or no unit. Going to use Bytes as default.")
                     unit_size = 1
-                self.size = str(int(number*unit_size))
+                return str(int(number*unit_size))
             else:
                 self.log_debug(f'Unit was not specified by user. Using Bytes as default unit.')
-                self.size = size
+                return size
         except Exception as e:
-            self.log_error(f'[parse_size] {e}' ,exception=True)
+            self.log_error(f'[convert_size] {e}' ,exception=True)
             raise Exception(e)
 
     def display_test_list(self):
@@ -495,6 +824,17 @@ class DemoTest:
             self.log_error(f'[display_test_list] {e}' ,exception=True)
             raise Exception(e)
 
+    def is_multi_node(self):
+        '''The following method is used to check whether the ranks requested in pure mode
+           span more than a single node, in which case every node runs its own HCCL demo wrapper.'''
+        try:
+            if not self.ranks_per_node:
+                self.get_ranks_per_node()
+            return self.nranks > min(self.ranks_per_node, self.nranks)
+        except Exception as e:
+            self.log_error(f'[is_multi_node] {e}' ,exception=True)
+            raise Exception(e)
+
     def get_ranks_per_node(self):
         '''The following method is used to find the number of ranks
            per node using lspci command, in case the argument
@@ -653,6 +993,11 @@ if __name__ == '__main__':
     try:
         DemoTestObj = DemoTest()
         DemoTestObj.prepare_demo()
-        DemoTestObj.run_demo()
+        if DemoTestObj.scenario:
+            DemoTestObj.run_scenario()
+        elif DemoTestObj.autotune:
+            DemoTestObj.run_autotune()
+        else:
+            DemoTestObj.run_demo()
     except Exception as e:
         DemoTestObj.exit_demo(f'[__main__] {e}', exception=True)
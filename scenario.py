@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+
+import os, json, time, itertools
+
+class Scenario:
+    def __init__(self, path, report_path, resume, defaults, test_list, convert_size):
+        self.path         = path
+        self.report_path  = report_path
+        self.resume       = resume
+        self.defaults     = defaults
+        self.test_list    = test_list
+        self.convert_size = convert_size
+        self.case_params  = ['test', 'size', 'loop', 'test_root']
+        self.cases        = []
+        self.completed    = set()
+
+    def load(self):
+        '''Read the scenario file. JSON is always supported, YAML requires the PyYAML package.'''
+        with open(self.path) as scenario_file:
+            if self.path.endswith(('.yaml', '.yml')):
+                try:
+                    import yaml
+                except ModuleNotFoundError:
+                    raise ValueError(f'PyYAML package is required for reading {self.path}, please install it or use a JSON scenario file')
+                scenario = yaml.safe_load(scenario_file)
+            else:
+                scenario = json.load(scenario_file)
+        if not isinstance(scenario, dict) or not isinstance(scenario.get('cases'), list) or not scenario['cases']:
+            raise ValueError(f'Scenario file {self.path} must contain a non empty "cases" list')
+        return scenario
+
+    def expand(self):
+        '''Expand every case of the scenario into the cross product of its list values.
+           Case parameters are taken from the case itself, then from the scenario "defaults"
+           and finally from the command line. Env overrides of the case are added to the scenario "env".'''
+        scenario = self.load()
+        self.cases = []
+        for index, case in enumerate(scenario['cases']):
+            unknown = set(case) - set(self.case_params) - {'name', 'env'}
+            if unknown:
+                raise ValueError(f'Case {index} of {self.path} has unknown parameters: {sorted(unknown)}')
+            params = dict(self.defaults)
+            params.update(scenario.get('defaults', {}))
+            params.update({key: value for key, value in case.items() if key in self.case_params})
+            env = dict(scenario.get('env', {}))
+            env.update(case.get('env', {}))
+            name = case.get('name', f'case_{index}')
+
+            dimensions = [(key, self.as_list(value)) for key, value in params.items()]
+            dimensions += [(f'env:{key}', self.as_list(value)) for key, value in env.items()]
+            keys   = [key for key, _ in dimensions]
+            values = [value for _, value in dimensions]
+            for combination in itertools.product(*values):
+                self.cases.append(self.create_case(name, dict(zip(keys, combination))))
+        return self.cases
+
+    def create_case(self, name, combination):
+        '''Create a single case out of one combination of the expanded parameters.'''
+        env = {key[len('env:'):]: str(value) for key, value in combination.items() if key.startswith('env:')}
+        case = {'name':       name,
+                'test':       str(combination['test']),
+                'size':       str(combination['size']),
+                'size_bytes': int(self.convert_size(combination['size'])),
+                'loop':       int(combination['loop']),
+                'test_root':  int(combination['test_root']),
+                'env':        env}
+        if case['test'] not in self.test_list:
+            raise ValueError(f'Case {name} uses test {case["test"]} which is not part of the tests list')
+        if case['loop'] < 1:
+            raise ValueError(f'Case {name} uses loop {case["loop"]}')
+        case['id'] = json.dumps({key: case[key] for key in ['name', 'test', 'size_bytes', 'loop', 'test_root', 'env']}, sort_keys=True)
+        return case
+
+    def as_list(self, value):
+        return value if isinstance(value, list) else [value]
+
+    def load_report(self):
+        '''Collect the cases completed by a previous run when resuming, otherwise start a new report.'''
+        self.completed = set()
+        if not os.path.exists(self.report_path):
+            return self.completed
+        if not self.resume:
+            os.remove(self.report_path)
+            return self.completed
+        for record in self.read_records(self.report_path):
+            self.completed.add(record['id'])
+        return self.completed
+
+    def get_launches(self):
+        '''Group the pending cases which can share a launch. Cases share a launch when they differ only
+           by their size, since HCCL demo tests a list of sizes using the same communicator.'''
+        launches = {}
+        for case in self.cases:
+            if case['id'] in self.completed:
+                continue
+            key = (case['test'], case['loop'], case['test_root'], tuple(sorted(case['env'].items())))
+            launch = launches.setdefault(key, {'test':      case['test'],
+                                               'loop':      case['loop'],
+                                               'test_root': case['test_root'],
+                                               'env':       case['env'],
+                                               'sizes':     [],
+                                               'cases':     []})
+            if case['size_bytes'] not in launch['sizes']:
+                launch['sizes'].append(case['size_bytes'])
+            launch['cases'].append(case)
+        return list(launches.values())
+
+    def record(self, launch, summary_path):
+        '''Append the results of a finished launch to the report, one line per case.
+           Returns the cases for which no result was found.'''
+        results = {}
+        if os.path.exists(summary_path):
+            for summary in self.read_records(summary_path):
+                results[(summary['test'], summary['size'])] = summary
+        missing = []
+        with open(self.report_path, 'a') as report_file:
+            for case in launch['cases']:
+                summary = results.get((case['test'], case['size_bytes']))
+                if not summary:
+                    missing.append(case)
+                    continue
+                record = dict(case)
+                record.update({key: value for key, value in summary.items() if key not in record})
+                record['timestamp'] = time.strftime('%Y-%m-%d %H:%M:%S')
+                report_file.write(json.dumps(record) + '\n')
+                self.completed.add(case['id'])
+        return missing
+
+    def get_report_lines(self):
+        '''Format the whole report, including cases completed before resuming, as a table.'''
+        records = self.read_records(self.report_path) if os.path.exists(self.report_path) else []
+        lines = [f'{"name".ljust(20)} {"test".ljust(15)} {"size".rjust(12)} {"loop".rjust(6)} '
+                 f'{"bandwidth".rjust(16)} {"max/min".rjust(8)}  env']
+        for record in records:
+            imbalance = record['max_duration'] / record['min_duration'] if record.get('min_duration') else 0
+            env = ' '.join(f'{key}={value}' for key, value in sorted(record['env'].items()))
+            lines.append(f'{record["name"][:20].ljust(20)} {record["test"].ljust(15)} {str(record["size_bytes"]).rjust(12)} '
+                         f'{str(record["loop"]).rjust(6)} {record["bandwidth"] / 1e6:11.3f} MB/s {imbalance:8.3f}  {env}')
+        return lines
+
+    def read_records(self, path):
+        records = []
+        with open(path) as records_file:
+            for line in records_file:
+                if line.strip():
+                    records.append(json.loads(line))
+        return records